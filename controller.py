@@ -3,26 +3,111 @@ Controller layer for the stamp collection application.
 Coordinates between Model and View following MVC pattern.
 """
 import os
-from PySide6.QtWidgets import QFileDialog, QMessageBox
+from PySide6.QtCore import QObject, QThread, QTimer, QEvent, QEventLoop, QMetaObject, Qt, Signal, Slot, Q_ARG
+from PySide6.QtWidgets import QApplication, QFileDialog, QMessageBox, QProgressDialog
 from typing import Optional, List
 
-from model import StampDatabase, Stamp, parse_date_field, get_decade_from_year, parse_decade_string
+import model
+from model import StampDatabase, Stamp, get_decade_from_year, parse_decade_string
 from view import MainWindow, StampDialog, StatisticsDialog, DecadeStatisticsDialog
 
+# File dialog filter for database files
+DATABASE_FILE_FILTER = (
+    "JSON Files (*.json);;Stamp DB (*.scdb);;MessagePack (*.msgpack *.mpk);;All Files (*)"
+)
+BINARY_FILE_FILTER = "MessagePack (*.msgpack *.mpk)"
 
-class StampController:
+
+class DatabaseIOWorker(QObject):
+    """
+    Worker that performs blocking database I/O on a background thread.
+    
+    The worker is moved to a QThread by the controller and its slots are
+    invoked with queued connections, so JSON parsing and file writes never
+    run on the GUI thread. Results are delivered back through signals.
+    """
+    
+    loaded = Signal(bool, object)  # Emits (success, loaded StampDatabase)
+    saved = Signal(bool, int)  # Emits (success, save request number)
+    
+    def __init__(self, database: StampDatabase):
+        super().__init__()
+        self.database = database
+    
+    @Slot(str)
+    def do_load(self, file_path: str):
+        """Load a database file into a fresh StampDatabase."""
+        database = StampDatabase()
+        success = database.load(file_path)
+        self.loaded.emit(success, database)
+    
+    @Slot(str, int)
+    def do_save(self, file_path: str, request: int):
+        """Save the current database (to its own file path if none is given)."""
+        self.saved.emit(self.database.save(file_path or None), request)
+
+
+class StampController(QObject):
     """Controller that manages interactions between Model and View."""
     
     def __init__(self):
+        super().__init__()
         self.database = StampDatabase()
         self.view = MainWindow()
         self.current_filter = "All Countries"
         self.current_decade_filter = "All Decades"
         self.current_search_text = ""
+        self._progress_dialog: Optional[QProgressDialog] = None
+        self._save_loop: Optional[QEventLoop] = None
+        self._save_result = False
+        # Save requests are numbered so results can be matched to callers
+        self._save_requests = 0
+        self._save_request: Optional[int] = None
+        # At most one auto-save runs at a time; further requests coalesce
+        self._autosave_request: Optional[int] = None
+        self._autosave_pending = False
+        self._last_title: Optional[str] = None
+        # Stamp dialogs are created on first use and reused afterwards
+        self._add_dialog: Optional[StampDialog] = None
+        self._edit_dialog: Optional[StampDialog] = None
+        # File dialogs too, so they remember their directory and filter
+        self._load_file_dialog: Optional[QFileDialog] = None
+        self._save_file_dialogs = {}
+        
+        # Background thread for database load/save
+        self.io_thread = QThread()
+        self._io_worker = DatabaseIOWorker(self.database)
+        self._io_worker.moveToThread(self.io_thread)
+        self._io_worker.loaded.connect(self._on_loaded)
+        self._io_worker.saved.connect(self._on_saved)
+        self.io_thread.start()
+        
+        # Coalesces rapid country filter changes into a single list rebuild
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(80)
+        self._filter_timer.timeout.connect(self._apply_filter)
+        
+        # Coalesces auto-saves from a burst of edits into one write
+        self._autosave_timer = QTimer(self)
+        self._autosave_timer.setSingleShot(True)
+        self._autosave_timer.setInterval(2000)
+        self._autosave_timer.timeout.connect(self._do_autosave)
+        
+        # Waits for a pause in typing before searching
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._apply_filter)
+        
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
         
         # Connect signals from view to controller methods
         self.view.load_database_requested.connect(self.load_database)
         self.view.save_database_requested.connect(self.save_database)
+        self.view.save_binary_requested.connect(self.save_database_as_binary)
         self.view.new_database_requested.connect(self.new_database)
         self.view.add_stamp_requested.connect(self.add_stamp)
         self.view.edit_stamp_requested.connect(self.edit_stamp)
@@ -33,11 +118,145 @@ class StampController:
         self.view.search_text_changed.connect(self.on_search_text_changed)
         self.view.statistics_requested.connect(self.show_statistics)
         self.view.decade_statistics_requested.connect(self.show_decade_statistics)
+        
+        # Watch for the main window closing, to offer to save unsaved changes
+        self.view.installEventFilter(self)
     
     def run(self):
         """Start the application."""
         self.view.show()
     
+    def shutdown(self):
+        """Stop the background I/O thread, finishing any outstanding auto-save."""
+        # Saves from a close prompt need the I/O thread, so stop prompting first
+        self.view.removeEventFilter(self)
+        autosave_due = self._autosave_due()
+        self._autosave_timer.stop()
+        self.io_thread.quit()
+        self.io_thread.wait()
+        
+        # Pending or queued auto-saves may not have run before the thread stopped
+        if autosave_due:
+            self._autosave_request = None
+            self._autosave_pending = False
+            if self.database.file_path and self.database.is_modified():
+                self.database.save()
+    
+    def _start_io(self, slot_name: str, label: str, *args):
+        """
+        Invoke a worker slot on the I/O thread and show a busy indicator.
+        
+        Args:
+            slot_name: Name of the DatabaseIOWorker slot to invoke
+            label: Text shown in the progress dialog
+            *args: Q_ARG arguments passed to the slot
+        """
+        self._progress_dialog = QProgressDialog(label, "", 0, 0, self.view)
+        self._progress_dialog.setCancelButton(None)
+        self._progress_dialog.setWindowTitle("Please Wait")
+        self._progress_dialog.setWindowModality(Qt.WindowModal)
+        self._progress_dialog.setMinimumDuration(0)
+        self._progress_dialog.show()
+        
+        QMetaObject.invokeMethod(self._io_worker, slot_name, Qt.QueuedConnection, *args)
+    
+    def _finish_io(self):
+        """Close the busy indicator shown by _start_io."""
+        if self._progress_dialog is not None:
+            self._progress_dialog.close()
+            self._progress_dialog.deleteLater()
+            self._progress_dialog = None
+    
+    def _save_in_background(self, file_path: Optional[str] = None) -> bool:
+        """
+        Save the database on the I/O thread, keeping the event loop running.
+        
+        Callers still get a synchronous result, but the GUI keeps repainting
+        while the file is written.
+        
+        Args:
+            file_path: Path to save to (uses current file_path if None)
+            
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        self._save_result = False
+        self._save_loop = QEventLoop()
+        self._save_request = self._next_save_request()
+        try:
+            self._start_io(
+                "do_save", "Saving database...",
+                Q_ARG(str, file_path or ""), Q_ARG(int, self._save_request)
+            )
+            self._save_loop.exec()
+        finally:
+            self._save_loop = None
+            self._save_request = None
+            self._finish_io()
+        
+        return self._save_result
+    
+    def _next_save_request(self) -> int:
+        """Return a new number identifying a save request."""
+        self._save_requests += 1
+        return self._save_requests
+    
+    def _request_autosave(self):
+        """Schedule an auto-save, restarting the delay so bursts of edits save once."""
+        if self.database.file_path:
+            self._autosave_timer.start()
+    
+    def _autosave_due(self) -> bool:
+        """Check whether an auto-save is scheduled, queued or running."""
+        return (
+            self._autosave_timer.isActive()
+            or self._autosave_request is not None
+            or self._autosave_pending
+        )
+    
+    def _flush_autosave(self):
+        """Complete any outstanding auto-save before the database is replaced."""
+        if self._autosave_due():
+            self._autosave_timer.stop()
+            self._autosave_pending = False
+            if self.database.file_path and self.database.is_modified():
+                self._save_in_background()
+    
+    @Slot()
+    def _do_autosave(self):
+        """
+        Save the database to its current file on the I/O thread without blocking.
+        
+        If an auto-save is already running, one more is queued to run after it.
+        """
+        if not self.database.file_path or not self.database.is_modified():
+            return
+        if self._autosave_request is not None:
+            self._autosave_pending = True
+            return
+        
+        self._autosave_request = self._next_save_request()
+        QMetaObject.invokeMethod(
+            self._io_worker, "do_save", Qt.QueuedConnection,
+            Q_ARG(str, ""), Q_ARG(int, self._autosave_request)
+        )
+    
+    @Slot(bool, int)
+    def _on_saved(self, success: bool, request: int):
+        """Receive the result of a background save."""
+        if request == self._autosave_request:
+            self._autosave_request = None
+            if not success:
+                self.view.set_status_message("Auto-save failed")
+            self._update_window_title()
+            if self._autosave_pending:
+                self._autosave_pending = False
+                self._do_autosave()
+        elif request == self._save_request:
+            self._save_result = success
+            if self._save_loop is not None:
+                self._save_loop.quit()
+    
     def validate_stamp_data(self, name: str, image_path: str, exclude_id: Optional[str] = None) -> Optional[str]:
         """
         Validate stamp data for uniqueness.
@@ -61,43 +280,82 @@ class StampController:
         return None
     
     def load_database(self):
-        """Load a database from a JSON file."""
-        file_path, _ = QFileDialog.getOpenFileName(
-            self.view,
-            "Load Database",
-            "",
-            "JSON Files (*.json);;All Files (*)"
-        )
+        """Ask for a JSON, .scdb or MessagePack file to load."""
+        if self._load_file_dialog is None:
+            self._load_file_dialog = QFileDialog(self.view, "Load Database", "", DATABASE_FILE_FILTER)
+            self._load_file_dialog.setAcceptMode(QFileDialog.AcceptOpen)
+            self._load_file_dialog.setFileMode(QFileDialog.ExistingFile)
+            self._load_file_dialog.fileSelected.connect(self._load_chosen_file)
+        # Window-modal open() returns at once; _load_chosen_file continues the load
+        self._load_file_dialog.open()
+    
+    def _choose_save_path(self, caption: str, default_name: str, name_filter: str) -> str:
+        """
+        Ask for a file to save to, reusing the dialog from earlier saves.
+        
+        The dialog is run modally, since callers need to know whether the
+        database was saved.
         
+        Args:
+            caption: Dialog title, which also identifies the reused dialog
+            default_name: File name suggested the first time the dialog opens
+            name_filter: File type filters offered by the dialog
+            
+        Returns:
+            The chosen path, or an empty string if the dialog was cancelled
+        """
+        dialog = self._save_file_dialogs.get(caption)
+        if dialog is None:
+            dialog = QFileDialog(self.view, caption, "", name_filter)
+            dialog.setAcceptMode(QFileDialog.AcceptSave)
+            dialog.selectFile(default_name)
+            self._save_file_dialogs[caption] = dialog
+        
+        if not dialog.exec():
+            return ""
+        return dialog.selectedFiles()[0]
+    
+    def _load_chosen_file(self, file_path: str):
+        """
+        Load a database file picked in the load dialog.
+        
+        Args:
+            file_path: Path to the JSON, .scdb or MessagePack file
+        """
         if file_path:
-            if self.database.is_modified():
-                reply = QMessageBox.question(
-                    self.view,
-                    "Unsaved Changes",
-                    "You have unsaved changes. Do you want to save before loading?",
-                    QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
-                )
-                
-                if reply == QMessageBox.Cancel:
-                    return
-                elif reply == QMessageBox.Yes:
-                    if not self.save_database():
-                        return
+            if not self._confirm_unsaved_changes("loading"):
+                return
             
-            if self.database.load(file_path):
-                self.refresh_view()
-                self.view.set_status_message(f"Loaded database: {file_path}")
-                QMessageBox.information(
-                    self.view,
-                    "Success",
-                    f"Database loaded successfully.\nTotal stamps: {len(self.database.stamps)}"
-                )
-            else:
-                QMessageBox.critical(
-                    self.view,
-                    "Error",
-                    "Failed to load database."
-                )
+            # Parse the file on the I/O thread; _on_loaded finishes the job
+            self._start_io("do_load", "Loading database...", Q_ARG(str, file_path))
+    
+    @Slot(bool, object)
+    def _on_loaded(self, success: bool, database: StampDatabase):
+        """
+        Receive the result of a background load.
+        
+        Args:
+            success: Whether the file was loaded successfully
+            database: The freshly loaded database
+        """
+        self._finish_io()
+        
+        if success:
+            self.database = database
+            self._io_worker.database = database
+            # Queued auto-saves were for the database just replaced
+            self._autosave_timer.stop()
+            self._autosave_pending = False
+            self.refresh_view()
+            self.view.show_transient_message(
+                f"Loaded database: {database.file_path} ({self.database.get_total_count()} stamps)"
+            )
+        else:
+            QMessageBox.critical(
+                self.view,
+                "Error",
+                "Failed to load database."
+            )
     
     def save_database(self) -> bool:
         """
@@ -108,23 +366,13 @@ class StampController:
         """
         if not self.database.file_path:
             # No file path set, prompt for one
-            file_path, _ = QFileDialog.getSaveFileName(
-                self.view,
-                "Save Database",
-                "stamps.json",
-                "JSON Files (*.json);;All Files (*)"
-            )
+            file_path = self._choose_save_path("Save Database", "stamps.json", DATABASE_FILE_FILTER)
             
             if not file_path:
                 return False
             
-            if self.database.save(file_path):
-                self.view.set_status_message(f"Saved database: {file_path}")
-                QMessageBox.information(
-                    self.view,
-                    "Success",
-                    "Database saved successfully."
-                )
+            if self._save_in_background(file_path):
+                self.view.show_transient_message(f"Saved database: {file_path}")
                 return True
             else:
                 QMessageBox.critical(
@@ -135,7 +383,7 @@ class StampController:
                 return False
         else:
             # Save to existing file path
-            if self.database.save():
+            if self._save_in_background():
                 self.view.set_status_message(f"Saved database: {self.database.file_path}")
                 return True
             else:
@@ -146,21 +394,78 @@ class StampController:
                 )
                 return False
     
-    def new_database(self):
-        """Create a new database."""
-        if self.database.is_modified():
-            reply = QMessageBox.question(
+    def save_database_as_binary(self) -> bool:
+        """
+        Save the current database to a MessagePack file chosen by the user.
+        
+        Returns:
+            True if saved successfully, False otherwise
+        """
+        if model.msgpack is None:
+            QMessageBox.warning(
                 self.view,
-                "Unsaved Changes",
-                "You have unsaved changes. Do you want to save before creating a new database?",
-                QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
+                "Binary Format Unavailable",
+                "Saving as binary requires the msgpack package."
             )
+            return False
+        
+        file_path = self._choose_save_path("Save as Binary", "stamps.msgpack", BINARY_FILE_FILTER)
+        
+        if not file_path:
+            return False
+        if not model.is_msgpack_path(file_path):
+            file_path += model.MSGPACK_EXTENSIONS[0]
+        
+        if self._save_in_background(file_path):
+            self._update_window_title()
+            self.view.show_transient_message(f"Saved database: {file_path}")
+            return True
+        QMessageBox.critical(
+            self.view,
+            "Error",
+            "Failed to save database."
+        )
+        return False
+    
+    def _confirm_unsaved_changes(self, action: str) -> bool:
+        """
+        Offer to save unsaved changes before they would be lost.
+        
+        Args:
+            action: What is about to happen, e.g. "loading"
             
-            if reply == QMessageBox.Cancel:
-                return
-            elif reply == QMessageBox.Yes:
-                if not self.save_database():
-                    return
+        Returns:
+            True to go ahead, False if the user cancelled or the save failed
+        """
+        self._flush_autosave()
+        if not self.database.is_modified():
+            return True
+        
+        reply = QMessageBox.question(
+            self.view,
+            "Unsaved Changes",
+            f"You have unsaved changes. Do you want to save before {action}?",
+            QMessageBox.Yes | QMessageBox.No | QMessageBox.Cancel
+        )
+        
+        if reply == QMessageBox.Cancel:
+            return False
+        elif reply == QMessageBox.Yes:
+            return self.save_database()
+        return True
+    
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Keep the main window open if the user cancels the unsaved-changes prompt."""
+        if watched is self.view and event.type() == QEvent.Close:
+            if not self._confirm_unsaved_changes("closing"):
+                event.ignore()
+                return True
+        return super().eventFilter(watched, event)
+    
+    def new_database(self):
+        """Create a new database."""
+        if not self._confirm_unsaved_changes("creating a new database"):
+            return
         
         self.database.clear()
         self.refresh_view()
@@ -168,17 +473,42 @@ class StampController:
     
     def add_stamp(self):
         """Add a new stamp to the collection."""
-        dialog = StampDialog(self.view, validation_callback=self.validate_stamp_data)
+        if self._add_dialog is None:
+            self._add_dialog = StampDialog(self.view, validation_callback=self.validate_stamp_data)
+        else:
+            self._add_dialog.reset()
+        dialog = self._add_dialog
         
         if dialog.exec():
             stamp = dialog.get_stamp_data()
             self.database.add_stamp(stamp)
             # Auto-save the database after adding a stamp
-            if self.database.file_path:
-                self.database.save()
-            self.refresh_view()
+            self._request_autosave()
+            # Only the new stamp's list item changes, so skip a full refresh
+            if self._matches_filters(stamp):
+                self.view.apply_diff(added=[stamp])
+            self._update_filter_options()
+            self._update_window_title()
             self.view.set_status_message("Stamp added successfully")
     
+    def batch_add_stamps(self, stamps: List[Stamp]):
+        """
+        Add many stamps at once, e.g. for an import.
+        
+        Index maintenance, the auto-save and the view update happen once for
+        the whole batch.
+        
+        Args:
+            stamps: Stamps to add
+        """
+        self.database.add_stamps(stamps)
+        # Auto-save once for the whole batch
+        self._request_autosave()
+        self.view.apply_diff(added=[stamp for stamp in stamps if self._matches_filters(stamp)])
+        self._update_filter_options()
+        self._update_window_title()
+        self.view.set_status_message(f"Added {len(stamps)} stamps")
+    
     def edit_stamp(self, unique_id: str):
         """
         Edit an existing stamp.
@@ -195,15 +525,24 @@ class StampController:
             )
             return
         
-        dialog = StampDialog(self.view, stamp, validation_callback=self.validate_stamp_data)
+        if self._edit_dialog is None:
+            self._edit_dialog = StampDialog(self.view, stamp, validation_callback=self.validate_stamp_data)
+        else:
+            self._edit_dialog.reset(stamp)
+        dialog = self._edit_dialog
         
         if dialog.exec():
             updated_stamp = dialog.get_stamp_data()
             if self.database.update_stamp(unique_id, updated_stamp):
                 # Auto-save the database after updating a stamp
-                if self.database.file_path:
-                    self.database.save()
-                self.refresh_view()
+                self._request_autosave()
+                # Update, add or drop just this stamp's list item
+                if self._matches_filters(updated_stamp):
+                    self.view.apply_diff(updated=[updated_stamp])
+                else:
+                    self.view.apply_diff(removed=[unique_id])
+                self._update_filter_options()
+                self._update_window_title()
                 self.view.set_status_message("Stamp updated successfully")
                 # Re-select the updated stamp
                 self.show_stamp_details(unique_id)
@@ -222,7 +561,9 @@ class StampController:
             unique_id: ID of the stamp to delete
         """
         if self.database.delete_stamp(unique_id):
-            self.refresh_view()
+            self.view.apply_diff(removed=[unique_id])
+            self._update_filter_options()
+            self._update_window_title()
             self.view.clear_stamp_details()
             self.view.set_status_message("Stamp deleted successfully")
         else:
@@ -245,14 +586,27 @@ class StampController:
     
     def refresh_view(self):
         """Refresh the view with current database state."""
-        stamps = self.database.get_all_stamps()
+        self._update_filter_options()
         
-        # Update country filter options
-        # Extract non-empty country values
-        countries = set(
-            stamp.country for stamp in stamps 
-            if stamp.country is not None and stamp.country.strip()
-        )
+        # Apply current filter; this also covers any debounced refresh queued
+        # by the filter update
+        self._filter_timer.stop()
+        self._search_timer.stop()
+        filtered_stamps = self.get_filtered_stamps()
+        self.view.update_stamp_list(filtered_stamps)
+        
+        self._update_window_title()
+    
+    def _update_filter_options(self):
+        """
+        Update the country and decade filter options from the database.
+        
+        If a selected filter value disappears, the view reports the new
+        selection and the list is re-filtered, so incremental list updates
+        must be applied before calling this.
+        """
+        # Update country filter options from the database's country index
+        countries = self.database.get_country_set()
         self.view.update_country_filter(list(countries))
         
         # Update decade filter options
@@ -269,29 +623,38 @@ class StampController:
         
         sorted_decades = sorted(decades, key=decade_sort_key)
         self.view.update_decade_filter(sorted_decades)
-        
-        # Apply current filter
-        filtered_stamps = self.get_filtered_stamps()
-        self.view.update_stamp_list(filtered_stamps)
-        
-        # Update window title to show database status
+    
+    def _update_window_title(self):
+        """Update window title to show database status."""
         title = "Stamp Collection Manager"
         if self.database.file_path:
             title += f" - {self.database.file_path}"
         if self.database.is_modified():
             title += " *"
-        self.view.setWindowTitle(title)
+        # Skip the Qt round-trip when the title hasn't changed
+        if title != self._last_title:
+            self._last_title = title
+            self.view.setWindowTitle(title)
     
     def get_filtered_stamps(self) -> List[Stamp]:
         """
         Get stamps filtered by current search text, country, and decade filters.
         
+        The full collection is only copied when no filter is active; searches
+        and index lookups build their result lists directly.
+        
         Returns:
             List of stamps matching the current filters.
         """
+        country_active = self.current_filter != "All Countries"
+        decade_active = self.current_decade_filter != "All Decades"
+        
         # Apply search filter first
         if self.current_search_text and self.current_search_text.strip():
             stamps = self.database.search_stamps(self.current_search_text)
+        elif country_active or decade_active:
+            # No search, so the country and decade indexes give the result directly
+            return self._get_indexed_stamps(country_active, decade_active)
         else:
             stamps = self.database.get_all_stamps()
         
@@ -302,13 +665,66 @@ class StampController:
                 if stamp.country is not None and stamp.country == self.current_filter
             ]
         
-        # Apply decade filter
+        return self._filter_by_decade(stamps)
+    
+    def _get_indexed_stamps(self, country_active: bool, decade_active: bool) -> List[Stamp]:
+        """
+        Get stamps matching the country and/or decade filters from the database indexes.
+        
+        When both filters are active, the smaller of the two index buckets is
+        scanned for the other criterion.
+        
+        Args:
+            country_active: Whether a country filter is selected
+            decade_active: Whether a decade filter is selected
+        
+        Returns:
+            List of stamps matching the active filters.
+        """
+        by_country = self.database.get_stamps_by_country(self.current_filter) if country_active else None
+        by_decade = self.database.get_stamps_by_decade(self.current_decade_filter) if decade_active else None
+        
+        if by_decade is None:
+            return by_country
+        if by_country is None:
+            return by_decade
+        if len(by_country) <= len(by_decade):
+            return self._filter_by_decade(by_country)
+        return [stamp for stamp in by_decade if stamp.country == self.current_filter]
+    
+    def _matches_filters(self, stamp: Stamp) -> bool:
+        """
+        Check whether a single stamp passes the current filters.
+        
+        Args:
+            stamp: Stamp to check
+        
+        Returns:
+            True if the stamp would be shown in the filtered list.
+        """
+        search_text = self.current_search_text.strip() if self.current_search_text else ""
+        if search_text and not stamp.matches_search(search_text.lower()):
+            return False
+        if self.current_filter != "All Countries" and stamp.country != self.current_filter:
+            return False
+        return bool(self._filter_by_decade([stamp]))
+    
+    def _filter_by_decade(self, stamps: List[Stamp]) -> List[Stamp]:
+        """
+        Apply the current decade filter to a list of stamps.
+        
+        Args:
+            stamps: Stamps to filter
+        
+        Returns:
+            List of stamps matching the current decade filter.
+        """
         if self.current_decade_filter != "All Decades":
             filtered_by_decade = []
             filter_decade = parse_decade_string(self.current_decade_filter)
             
             for stamp in stamps:
-                year = parse_date_field(stamp.dates)
+                year = stamp.year()
                 
                 if filter_decade is None:
                     # "Unknown" filter - include stamps with unparseable dates
@@ -326,8 +742,13 @@ class StampController:
         return stamps
     
     def on_country_filter_changed(self, country: str):
-        """Handle country filter change."""
+        """Handle country filter change, deferring the refresh until changes settle."""
         self.current_filter = country
+        self._filter_timer.start()
+    
+    @Slot()
+    def _apply_filter(self):
+        """Apply the current filters once a debounce timer fires."""
         self.update_filtered_view()
     
     def on_decade_filter_changed(self, decade: str):
@@ -336,12 +757,15 @@ class StampController:
         self.update_filtered_view()
     
     def on_search_text_changed(self, text: str):
-        """Handle search text change."""
+        """Handle search text change, deferring the search until typing pauses."""
         self.current_search_text = text
-        self.update_filtered_view()
+        self._search_timer.start()
     
     def update_filtered_view(self):
         """Update the view with current filters applied."""
+        # Any pending debounced refresh is covered by this one
+        self._filter_timer.stop()
+        self._search_timer.stop()
         filtered_stamps = self.get_filtered_stamps()
         self.view.update_stamp_list(filtered_stamps)
         
@@ -1,16 +1,143 @@
 """
 Model layer for the stamp collection application.
-Handles data management and persistence using JSON.
+Handles data management and persistence using JSON (optionally compressed)
+or MessagePack.
 """
 import json
 import os
 import re
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Union
-from datetime import datetime
-import uuid
+import secrets
+import threading
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Set, Union
+from datetime import datetime, timezone
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
+try:
+    import ujson
+except ImportError:  # pragma: no cover - ujson is an optional fallback speedup
+    ujson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack enables the optional binary format
+    msgpack = None
+
+# Buffer size for database file I/O, so large files move in few big syscalls
+_IO_BUFFER_SIZE = 1 << 20
+
+# Stamps serialized per write when streaming a save to disk
+_STREAM_BATCH_SIZE = 1000
+
+# Compressed database format: this header followed by zlib-compressed JSON
+COMPRESSED_EXTENSION = '.scdb'
+_COMPRESSED_MAGIC = b'SCDB\x01'
+_COMPRESSION_LEVEL = 3
+
+# Binary database format, available when msgpack is installed
+MSGPACK_EXTENSIONS = ('.msgpack', '.mpk')
+
+
+def is_msgpack_path(file_path: str) -> bool:
+    """Return True if file_path names a MessagePack database."""
+    return file_path.lower().endswith(MSGPACK_EXTENSIONS)
+
+
+def _json_loads(raw: bytes):
+    """Parse JSON bytes, using orjson or ujson when one is available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    if ujson is not None:
+        return ujson.loads(raw)
+    return json.loads(raw)
+
+
+def _decode_database(raw: bytes, binary: bool = False):
+    """Parse database file contents as MessagePack if binary, else (compressed) JSON."""
+    if binary:
+        return msgpack.unpackb(raw, raw=False)
+    if raw.startswith(_COMPRESSED_MAGIC):
+        raw = zlib.decompress(raw[len(_COMPRESSED_MAGIC):])
+    return _json_loads(raw)
+
+
+def _write_database(f, stamps, metadata, compressed: bool) -> None:
+    """Stream stamps to f one record at a time, as compressed .scdb data if requested."""
+    if compressed:
+        f.write(_COMPRESSED_MAGIC)
+        compressor = zlib.compressobj(_COMPRESSION_LEVEL)
+        
+        def write(chunk):
+            f.write(compressor.compress(chunk))
+    else:
+        write = f.write
+    
+    write(b'{"stamps":[')
+    # Serialize in batches so memory stays bounded without a call per record
+    for start in range(0, len(stamps), _STREAM_BATCH_SIZE):
+        if start:
+            write(b',')
+        batch = stamps[start:start + _STREAM_BATCH_SIZE]
+        write(b','.join([_json_dumps(stamp.to_dict()) for stamp in batch]))
+    write(b'],"metadata":')
+    write(_json_dumps(metadata))
+    write(b'}')
+    if compressed:
+        f.write(compressor.flush())
+
+
+def _write_msgpack_database(f, stamps, metadata) -> None:
+    """Stream stamps to f as a MessagePack map with the same layout as the JSON format."""
+    packer = msgpack.Packer(use_bin_type=True, default=_json_default)
+    f.write(packer.pack_map_header(2))
+    f.write(packer.pack('stamps'))
+    f.write(packer.pack_array_header(len(stamps)))
+    for start in range(0, len(stamps), _STREAM_BATCH_SIZE):
+        batch = stamps[start:start + _STREAM_BATCH_SIZE]
+        f.write(b''.join([packer.pack(stamp.to_dict()) for stamp in batch]))
+    f.write(packer.pack('metadata'))
+    f.write(packer.pack(metadata))
+
+
+def _json_dumps(data) -> bytes:
+    """Serialize data to compact UTF-8 JSON bytes, using orjson or ujson when available."""
+    if orjson is not None:
+        # orjson formats datetimes natively, writing UTC offsets as "Z"
+        return orjson.dumps(data, option=orjson.OPT_UTC_Z)
+    if ujson is not None:
+        return ujson.dumps(
+            data, ensure_ascii=False, escape_forward_slashes=False, default=_json_default
+        ).encode('utf-8')
+    # json.dumps without indent uses the C encoder; json.dump(data, f) would
+    # fall back to the pure-Python iterencode path
+    return json.dumps(
+        data, ensure_ascii=False, separators=(',', ':'), default=_json_default
+    ).encode('utf-8')
+
+
+def _json_default(obj):
+    """Serialize datetimes for the fallback encoders the same way orjson does."""
+    if isinstance(obj, datetime):
+        text = obj.isoformat()
+        return text[:-6] + 'Z' if text.endswith('+00:00') else text
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Date field pattern, compiled once for parse_date_field: an optional
+# "circa"/"c."/"ca." prefix, then a year, "1840-1850" or "1840 to 1850"
+_DATE_RE = re.compile(
+    r'^(?:(?:circa|c\.|ca\.)\s*)?(\d{4})(?:\s*-\s*(\d{4})|\s+to\s+(\d{4}))?$',
+    re.IGNORECASE
+)
+
 
 class DateUtils:
     """Utility class for date parsing and manipulation."""
@@ -34,42 +161,35 @@ class DateUtils:
         """
         if not date_str or not isinstance(date_str, str):
             return None
-        
+        return DateUtils._parse_date_text(date_str)
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_date_text(date_str: str) -> Optional[int]:
+        """Parse a non-empty date string; cached, as collections repeat the same dates."""
         # Clean up the string
         date_str = date_str.strip()
         if not date_str:
             return None
         
-        # Handle circa dates - remove "circa", "c.", "ca." (case insensitive)
-        circa_pattern = r'^(circa|c\.|ca\.)\s*'
-        date_str = re.sub(circa_pattern, '', date_str, flags=re.IGNORECASE).strip()
-        
-        # Try to match year range with dash (e.g., "1840-1850")
-        range_dash_pattern = r'^(\d{4})\s*-\s*(\d{4})$'
-        match = re.match(range_dash_pattern, date_str)
-        if match:
-            start_year = int(match.group(1))
-            end_year = int(match.group(2))
-            # Return mid-year
-            return (start_year + end_year) // 2
-        
-        # Try to match year range with 'to' (e.g., "1840 to 1850")
-        range_to_pattern = r'^(\d{4})\s+to\s+(\d{4})$'
-        match = re.match(range_to_pattern, date_str, flags=re.IGNORECASE)
-        if match:
-            start_year = int(match.group(1))
-            end_year = int(match.group(2))
-            # Return mid-year
-            return (start_year + end_year) // 2
-        
-        # Try to match single year (e.g., "1840")
-        single_year_pattern = r'^(\d{4})$'
-        match = re.match(single_year_pattern, date_str)
-        if match:
-            return int(match.group(1))
-        
-        # Could not parse
-        return None
+        # Fast paths for the common "1840" and "1840-1850" forms, skipping the
+        # regexes; isdecimal() accepts exactly the digits \d and int() do
+        if len(date_str) == 4 and date_str.isdecimal():
+            return int(date_str)
+        if (len(date_str) == 9 and date_str[4] == '-'
+                and date_str[:4].isdecimal() and date_str[5:].isdecimal()):
+            return (int(date_str[:4]) + int(date_str[5:])) // 2
+        
+        # One match covers circa dates, dash and 'to' ranges, and single years
+        match = _DATE_RE.match(date_str)
+        if match is None:
+            return None
+        start_year, dash_end, to_end = match.groups()
+        end_year = dash_end or to_end
+        if end_year is None:
+            return int(start_year)
+        # Return mid-year
+        return (int(start_year) + int(end_year)) // 2
     
     @staticmethod
     def get_decade_from_year(year: int) -> int:
@@ -106,6 +226,21 @@ class DateUtils:
                 return int(decade_str)
         except ValueError:
             return None
+    
+    @staticmethod
+    def format_decade(decade: Optional[int]) -> str:
+        """
+        Format a numeric decade as a decade string.
+        
+        Args:
+            decade: The decade as an integer (e.g., 1840), or None for unknown dates
+            
+        Returns:
+            The decade string (e.g., "1840s"), or "Unknown" if decade is None
+        """
+        if decade is None:
+            return "Unknown"
+        return f"{decade}s"
 
 
 # Backward compatibility: Keep module-level functions as aliases
@@ -124,10 +259,26 @@ def parse_decade_string(decade_str: str) -> Optional[int]:
     return DateUtils.parse_decade_string(decade_str)
 
 
-@dataclass
+def format_decade(decade: Optional[int]) -> str:
+    """Format a numeric decade as a decade string. See DateUtils.format_decade."""
+    return DateUtils.format_decade(decade)
+
+
+def _new_unique_id() -> str:
+    """
+    Generate a new stamp ID.
+    
+    Returns:
+        32 random hex characters; os.urandom-backed like uuid4, but without
+        building a UUID object and formatting it with hyphens
+    """
+    return secrets.token_hex(16)
+
+
+@dataclass(slots=True)
 class Stamp:
     """Represents a single stamp entry in the collection."""
-    unique_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    unique_id: str = field(default_factory=_new_unique_id)
     name: str = ""
     country: str = ""
     image_path: str = ""
@@ -136,31 +287,281 @@ class Stamp:
     catalogue_ids: str = ""
     collection_number: str = ""
     keywords: str = ""
+    # Cache for year(): (dates string it was parsed from, parsed year)
+    _year_cache: tuple = field(default=(None, None), init=False, repr=False, compare=False)
+    # Cache for matches_search(): (searchable field values, lowercased blob)
+    _search_cache: tuple = field(default=(None, ""), init=False, repr=False, compare=False)
     
     def to_dict(self) -> dict:
         """Convert stamp to dictionary."""
-        return asdict(self)
+        # Built directly rather than with asdict(), which deep-copies every value
+        return {
+            'unique_id': self.unique_id,
+            'name': self.name,
+            'country': self.country,
+            'image_path': self.image_path,
+            'dates': self.dates,
+            'comments': self.comments,
+            'catalogue_ids': self.catalogue_ids,
+            'collection_number': self.collection_number,
+            'keywords': self.keywords
+        }
+    
+    def year(self) -> Optional[int]:
+        """
+        Get the representative year of the stamp's dates field.
+        
+        The parsed year is cached and re-parsed only when dates changes.
+        
+        Returns:
+            Year as an integer, or None if dates cannot be parsed
+        """
+        cached_dates, year = self._year_cache
+        if cached_dates != self.dates:
+            year = parse_date_field(self.dates)
+            self._year_cache = (self.dates, year)
+        return year
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Stamp':
         """Create stamp from dictionary."""
         return cls(**data)
+    
+    def matches_search(self, search_lower: str) -> bool:
+        """
+        Check whether any text field contains the search text.
+        
+        Args:
+            search_lower: Lowercased, stripped search text
+            
+        Returns:
+            True if the text appears in name, country, dates, collection_number,
+            catalogue_ids, keywords or comments
+        """
+        return search_lower in self._search_blob()
+    
+    def _search_blob(self) -> str:
+        """
+        Get the lowercased searchable fields as one string.
+        
+        Fields are joined with NUL so a match can't span two fields. The blob is
+        cached together with the field values and rebuilt when any of them change.
+        """
+        searchable_fields = (
+            self.name,
+            self.country,
+            self.dates,
+            self.collection_number,
+            self.catalogue_ids,
+            self.keywords,
+            self.comments
+        )
+        cached_fields, blob = self._search_cache
+        if cached_fields != searchable_fields:
+            blob = '\x00'.join(field.lower() for field in searchable_fields if field)
+            self._search_cache = (searchable_fields, blob)
+        return blob
 
 
 class StampDatabase:
     """Manages the stamp collection database using JSON."""
     
     def __init__(self):
-        self.stamps: List[Stamp] = []
+        # unique_id -> Stamp; dicts keep insertion order, so this is also the
+        # collection order, and lookups, updates and deletes are O(1)
+        self._by_id: Dict[str, Stamp] = {}
         self.file_path: Optional[str] = None
         self._modified = False
+        # Bumped on every change, so a save running on another thread only
+        # clears the modified flag if nothing changed since its snapshot
+        self._generation = 0
+        self._state_lock = threading.Lock()
+        # Country -> {unique_id: Stamp}, maintained incrementally so the
+        # country filter and country list don't have to scan every stamp
+        self._by_country: Dict[str, Dict[str, Stamp]] = {}
+        # Decade (1840, or None for unparseable dates) -> {unique_id: Stamp}
+        self._by_decade: Dict[Optional[int], Dict[str, Stamp]] = {}
+        # Name / image path -> {unique_id: Stamp}, for the uniqueness checks
+        self._by_name: Dict[str, Dict[str, Stamp]] = {}
+        self._by_image_path: Dict[str, Dict[str, Stamp]] = {}
+        # unique_id -> the keys from _index_keys() each stamp is indexed under,
+        # so a stamp edited in place can still be taken out of its old buckets
+        self._indexed_keys: Dict[str, tuple] = {}
+        # unique_id -> increasing number in collection order, so a stamp moved
+        # to another bucket can be put back in its place rather than at the end
+        self._positions: Dict[str, int] = {}
+        self._next_position = 0
+        # While buffered() is active, index updates are deferred to one rebuild
+        self._buffer_depth = 0
+        self._indexes_stale = False
+    
+    @property
+    def stamps(self) -> List[Stamp]:
+        """All stamps in collection order, as a new list."""
+        return list(self._by_id.values())
+    
+    def _set_stamps(self, stamps: List[Stamp]) -> int:
+        """
+        Replace the whole collection and rebuild the indexes.
+        
+        Returns:
+            Number of stamps given a new unique_id because theirs was a duplicate
+        """
+        by_id = {}
+        replaced = 0
+        for stamp in stamps:
+            if stamp.unique_id in by_id:
+                # IDs must be unique to address stamps, so give duplicates a new one
+                stamp.unique_id = _new_unique_id()
+                replaced += 1
+            by_id[stamp.unique_id] = stamp
+        self._by_id = by_id
+        self._rebuild_indexes()
+        return replaced
+    
+    def _mark_modified(self) -> None:
+        """Flag unsaved changes and invalidate any save already in progress."""
+        with self._state_lock:
+            self._generation += 1
+            self._modified = True
+    
+    @staticmethod
+    def _decade_key(stamp: Stamp) -> Optional[int]:
+        """Get the decade (1840, or None if unknown) a stamp is counted under."""
+        year = stamp.year()
+        if year is None:
+            return None
+        return get_decade_from_year(year)
+    
+    @staticmethod
+    def _discard(index: Dict, key, unique_id: str) -> None:
+        """Remove a stamp from an index bucket, dropping the bucket once empty."""
+        bucket = index.get(key)
+        if bucket is not None:
+            bucket.pop(unique_id, None)
+            if not bucket:
+                del index[key]
+    
+    def _index_keys(self, stamp: Stamp) -> tuple:
+        """Get the (country, decade, name, image path) keys a stamp is indexed under."""
+        return (stamp.country, self._decade_key(stamp), stamp.name, stamp.image_path)
+    
+    def _indexes(self) -> tuple:
+        """Get the indexes in _index_keys() order, each with whether None is a key in it."""
+        # None values aren't indexed, except in the decade index where None means unknown
+        return (
+            (self._by_country, False),
+            (self._by_decade, True),
+            (self._by_name, False),
+            (self._by_image_path, False),
+        )
+    
+    def _add_to_indexes(self, stamp: Stamp) -> None:
+        """Add a stamp to the end of the country, decade, name and image path indexes."""
+        keys = self._index_keys(stamp)
+        self._indexed_keys[stamp.unique_id] = keys
+        self._positions[stamp.unique_id] = self._next_position
+        self._next_position += 1
+        for (index, none_is_key), key in zip(self._indexes(), keys):
+            if key is not None or none_is_key:
+                index.setdefault(key, {})[stamp.unique_id] = stamp
+    
+    def _index_stamp(self, stamp: Stamp) -> None:
+        """Add a stamp to the incrementally maintained indexes."""
+        if self._buffer_depth:
+            self._indexes_stale = True
+            return
+        self._add_to_indexes(stamp)
+    
+    def _unindex_stamp(self, stamp: Stamp) -> None:
+        """Remove a stamp from the incrementally maintained indexes."""
+        if self._buffer_depth:
+            self._indexes_stale = True
+            return
+        keys = self._indexed_keys.pop(stamp.unique_id, None)
+        self._positions.pop(stamp.unique_id, None)
+        if keys is None:
+            return
+        for (index, _), key in zip(self._indexes(), keys):
+            self._discard(index, key, stamp.unique_id)
+    
+    def _reindex_stamp(self, stamp: Stamp) -> None:
+        """
+        Move an updated stamp between index buckets, keeping each bucket in collection order.
+        
+        The stamp may be a replacement or the indexed object edited in place;
+        either way it leaves the buckets recorded when it was last indexed.
+        """
+        if self._buffer_depth:
+            self._indexes_stale = True
+            return
+        unique_id = stamp.unique_id
+        new_keys = self._index_keys(stamp)
+        old_keys = self._indexed_keys.get(unique_id, new_keys)
+        self._indexed_keys[unique_id] = new_keys
+        for (index, none_is_key), old_key, new_key in zip(self._indexes(), old_keys, new_keys):
+            indexed = new_key is not None or none_is_key
+            if not indexed:
+                self._discard(index, old_key, unique_id)
+            elif old_key == new_key:
+                # Reassigning an existing entry keeps the stamp's place in its bucket
+                index.setdefault(new_key, {})[unique_id] = stamp
+            else:
+                self._discard(index, old_key, unique_id)
+                self._insert_in_order(index, new_key, stamp)
+    
+    def _insert_in_order(self, index: Dict, key, stamp: Stamp) -> None:
+        """Add a stamp to an index bucket at its collection-order position."""
+        bucket = index.setdefault(key, {})
+        positions = self._positions
+        if not bucket or positions[next(reversed(bucket))] < positions[stamp.unique_id]:
+            bucket[stamp.unique_id] = stamp
+            return
+        # Dicts can only append, so rebuild the bucket with the stamp in its place
+        entries = list(bucket.items())
+        entries.append((stamp.unique_id, stamp))
+        entries.sort(key=lambda entry: positions[entry[0]])
+        index[key] = dict(entries)
+    
+    def _rebuild_indexes(self) -> None:
+        """Rebuild all indexes from scratch after the collection is replaced."""
+        self._by_country = {}
+        self._by_decade = {}
+        self._by_name = {}
+        self._by_image_path = {}
+        self._indexed_keys = {}
+        self._positions = {}
+        self._next_position = 0
+        self._indexes_stale = False
+        for stamp in self._by_id.values():
+            self._add_to_indexes(stamp)
+    
+    @contextmanager
+    def buffered(self) -> Iterator['StampDatabase']:
+        """
+        Group a burst of changes, such as a bulk import.
+        
+        Index maintenance is skipped for each change and done as a single
+        rebuild when the outermost buffered block exits. Country lookups made
+        inside the block may not reflect changes made in it.
+        
+        Yields:
+            This database
+        """
+        self._buffer_depth += 1
+        try:
+            yield self
+        finally:
+            self._buffer_depth -= 1
+            if self._buffer_depth == 0 and self._indexes_stale:
+                self._rebuild_indexes()
     
     def load(self, file_path: str) -> bool:
         """
-        Load database from JSON file.
+        Load database from a JSON, compressed .scdb or MessagePack file.
         
         Args:
-            file_path: Path to the JSON database file
+            file_path: Path to the database file
             
         Returns:
             True if successful, False otherwise
@@ -168,16 +569,25 @@ class StampDatabase:
         try:
             if not os.path.exists(file_path):
                 # Create empty database if file doesn't exist
-                self.stamps = []
+                self._set_stamps([])
                 self.file_path = file_path
                 self._modified = False
                 return True
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.stamps = [Stamp.from_dict(stamp_data) for stamp_data in data.get('stamps', [])]
+            binary = is_msgpack_path(file_path)
+            if binary and msgpack is None:
+                print("Error loading database: msgpack is not installed")
+                return False
+            
+            with open(file_path, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                data = _decode_database(f.read(), binary)
+                replaced = self._set_stamps([Stamp.from_dict(stamp_data) for stamp_data in data.get('stamps', [])])
                 self.file_path = file_path
                 self._modified = False
+                if replaced:
+                    # The new IDs only exist in memory until saved, so flag them as a change
+                    print(f"Warning: gave {replaced} stamp(s) with duplicate IDs new IDs")
+                    self._mark_modified()
                 return True
         except Exception as e:
             print(f"Error loading database: {e}")
@@ -185,7 +595,8 @@ class StampDatabase:
     
     def save(self, file_path: Optional[str] = None) -> bool:
         """
-        Save database to JSON file.
+        Save database to file, as compressed JSON if the path ends in .scdb
+        or MessagePack if it ends in .msgpack/.mpk.
         
         Args:
             file_path: Path to save to (uses current file_path if None)
@@ -197,29 +608,77 @@ class StampDatabase:
         if not save_path:
             return False
         
+        binary = is_msgpack_path(save_path)
+        if binary and msgpack is None:
+            print("Error saving database: msgpack is not installed")
+            return False
+        
+        # Snapshot the list so the GUI thread can keep editing during a background save
+        with self._state_lock:
+            stamps = list(self._by_id.values())
+            generation = self._generation
+            original_path = self.file_path
+        
         try:
-            data = {
-                'stamps': [stamp.to_dict() for stamp in self.stamps],
-                'metadata': {
-                    'version': '1.0',
-                    'last_modified': datetime.now().isoformat()
-                }
+            metadata = {
+                'version': '1.0',
+                # Left to the encoder to format
+                'last_modified': datetime.now(timezone.utc)
             }
             
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Write a sibling file and swap it in, so a crash or error
+            # mid-save never leaves a truncated database behind
+            temp_path = save_path + '.tmp'
+            try:
+                with open(temp_path, 'wb', buffering=_IO_BUFFER_SIZE) as f:
+                    if binary:
+                        _write_msgpack_database(f, stamps, metadata)
+                    else:
+                        compressed = save_path.lower().endswith(COMPRESSED_EXTENSION)
+                        _write_database(f, stamps, metadata, compressed)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, save_path)
+            finally:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
             
-            self.file_path = save_path
-            self._modified = False
+            with self._state_lock:
+                # Leave file_path alone if clear() reset it while saving
+                if self.file_path == original_path:
+                    self.file_path = save_path
+                if self._generation == generation:
+                    self._modified = False
             return True
         except Exception as e:
             print(f"Error saving database: {e}")
             return False
     
     def add_stamp(self, stamp: Stamp) -> None:
-        """Add a new stamp to the collection."""
-        self.stamps.append(stamp)
-        self._modified = True
+        """
+        Add a new stamp to the collection.
+        
+        A stamp whose unique_id is already in use is given a new one.
+        """
+        if stamp.unique_id in self._by_id:
+            stamp.unique_id = _new_unique_id()
+        self._by_id[stamp.unique_id] = stamp
+        self._index_stamp(stamp)
+        self._mark_modified()
+    
+    def add_stamps(self, stamps: Iterable[Stamp]) -> None:
+        """
+        Add several stamps to the collection, such as for an import.
+        
+        The indexes are rebuilt once for the whole batch rather than updated
+        per stamp. A stamp whose unique_id is already in use is given a new one.
+        
+        Args:
+            stamps: Stamps to add, in collection order
+        """
+        with self.buffered():
+            for stamp in stamps:
+                self.add_stamp(stamp)
     
     def update_stamp(self, unique_id: str, updated_stamp: Stamp) -> bool:
         """
@@ -232,14 +691,15 @@ class StampDatabase:
         Returns:
             True if stamp was found and updated, False otherwise
         """
-        for i, stamp in enumerate(self.stamps):
-            if stamp.unique_id == unique_id:
-                # Preserve the original unique_id
-                updated_stamp.unique_id = unique_id
-                self.stamps[i] = updated_stamp
-                self._modified = True
-                return True
-        return False
+        if unique_id not in self._by_id:
+            return False
+        
+        # Preserve the original unique_id
+        updated_stamp.unique_id = unique_id
+        self._by_id[unique_id] = updated_stamp
+        self._reindex_stamp(updated_stamp)
+        self._mark_modified()
+        return True
     
     def delete_stamp(self, unique_id: str) -> bool:
         """
@@ -251,12 +711,13 @@ class StampDatabase:
         Returns:
             True if stamp was found and deleted, False otherwise
         """
-        for i, stamp in enumerate(self.stamps):
-            if stamp.unique_id == unique_id:
-                del self.stamps[i]
-                self._modified = True
-                return True
-        return False
+        stamp = self._by_id.pop(unique_id, None)
+        if stamp is None:
+            return False
+        
+        self._unindex_stamp(stamp)
+        self._mark_modified()
+        return True
     
     def get_stamp(self, unique_id: str) -> Optional[Stamp]:
         """
@@ -268,14 +729,11 @@ class StampDatabase:
         Returns:
             Stamp if found, None otherwise
         """
-        for stamp in self.stamps:
-            if stamp.unique_id == unique_id:
-                return stamp
-        return None
+        return self._by_id.get(unique_id)
     
     def get_all_stamps(self) -> List[Stamp]:
-        """Get all stamps in the collection."""
-        return self.stamps.copy()
+        """Get all stamps in the collection, as a new list the caller may keep or modify."""
+        return list(self._by_id.values())
     
     def search_stamps(self, search_text: str) -> List[Stamp]:
         """
@@ -290,30 +748,10 @@ class StampDatabase:
             List of stamps matching the search text
         """
         if not search_text or not search_text.strip():
-            return self.stamps.copy()
+            return list(self._by_id.values())
         
         search_lower = search_text.lower().strip()
-        matching_stamps = []
-        
-        for stamp in self.stamps:
-            # Search in all text fields
-            searchable_fields = [
-                stamp.name,
-                stamp.country,
-                stamp.dates,
-                stamp.collection_number,
-                stamp.catalogue_ids,
-                stamp.keywords,
-                stamp.comments
-            ]
-            
-            # Check if search text appears in any field (case-insensitive)
-            for field in searchable_fields:
-                if field and search_lower in field.lower():
-                    matching_stamps.append(stamp)
-                    break  # Found a match, no need to check other fields
-        
-        return matching_stamps
+        return [stamp for stamp in self._by_id.values() if stamp.matches_search(search_lower)]
     
     def is_modified(self) -> bool:
         """Check if the database has unsaved changes."""
@@ -321,9 +759,65 @@ class StampDatabase:
     
     def clear(self) -> None:
         """Clear all stamps from the database."""
-        self.stamps = []
-        self.file_path = None
-        self._modified = False
+        self._set_stamps([])
+        with self._state_lock:
+            self._generation += 1
+            self.file_path = None
+            self._modified = False
+    
+    def get_country_set(self) -> Set[str]:
+        """
+        Get the set of non-blank countries in the collection.
+        
+        Returns:
+            Set of country names, read from an incrementally maintained index.
+        """
+        return {country for country in self._by_country if country.strip()}
+    
+    def get_stamps_by_country(self, country: str) -> List[Stamp]:
+        """
+        Get all stamps from a country using the country index.
+        
+        Args:
+            country: Exact country name to look up
+            
+        Returns:
+            List of stamps with that country (empty if there are none)
+        """
+        bucket = self._by_country.get(country)
+        return list(bucket.values()) if bucket else []
+    
+    def get_stamps_by_decade(self, decade: str) -> List[Stamp]:
+        """
+        Get all stamps from a decade using the decade index.
+        
+        Args:
+            decade: Decade label, e.g. "1840s", or "Unknown" for unparseable dates
+            
+        Returns:
+            List of stamps in that decade, in collection order (empty if there are none)
+        """
+        key = parse_decade_string(decade)
+        if key is None and decade != "Unknown":
+            return []
+        bucket = self._by_decade.get(key)
+        return list(bucket.values()) if bucket else []
+    
+    def get_stamps_by_name(self, name: str) -> List[Stamp]:
+        """
+        Get all stamps with a name using the name index.
+        
+        Names are normally unique, but the model doesn't enforce it, so
+        this returns a list like the other index lookups.
+        
+        Args:
+            name: Exact stamp name to look up
+            
+        Returns:
+            List of stamps with that name (empty if there are none)
+        """
+        bucket = self._by_name.get(name)
+        return list(bucket.values()) if bucket else []
     
     def get_country_statistics(self) -> dict:
         """
@@ -332,10 +826,18 @@ class StampDatabase:
         Returns:
             Dictionary mapping country names to their stamp counts.
         """
+        # Read from the country index, so this scales with the number of countries
         country_counts = {}
-        for stamp in self.stamps:
-            country = stamp.country if stamp.country and stamp.country.strip() else "Unknown"
-            country_counts[country] = country_counts.get(country, 0) + 1
+        known = 0
+        for country, bucket in self._by_country.items():
+            if country.strip():
+                country_counts[country] = country_counts.get(country, 0) + len(bucket)
+                known += len(bucket)
+        
+        # Blank or missing countries are grouped under "Unknown"
+        unknown = len(self._by_id) - known
+        if unknown:
+            country_counts["Unknown"] = country_counts.get("Unknown", 0) + unknown
         return country_counts
     
     def get_total_count(self) -> int:
@@ -345,7 +847,7 @@ class StampDatabase:
         Returns:
             Total stamp count.
         """
-        return len(self.stamps)
+        return len(self._by_id)
     
     def is_name_in_use(self, name: str, exclude_id: Optional[str] = None) -> bool:
         """
@@ -360,11 +862,7 @@ class StampDatabase:
         """
         if not name or not name.strip():
             return False
-        
-        for stamp in self.stamps:
-            if stamp.unique_id != exclude_id and stamp.name == name:
-                return True
-        return False
+        return self._is_value_in_use(self._by_name, 'name', name, exclude_id)
     
     def is_image_path_in_use(self, image_path: str, exclude_id: Optional[str] = None) -> bool:
         """
@@ -379,33 +877,62 @@ class StampDatabase:
         """
         if not image_path or not image_path.strip():
             return False
-        
-        for stamp in self.stamps:
-            if stamp.unique_id != exclude_id and stamp.image_path == image_path:
-                return True
-        return False
+        return self._is_value_in_use(self._by_image_path, 'image_path', image_path, exclude_id)
+    
+    def _is_value_in_use(
+        self,
+        index: Dict[str, Dict[str, Stamp]],
+        attr: str,
+        value: str,
+        exclude_id: Optional[str]
+    ) -> bool:
+        """Check an index for stamps other than exclude_id having attr equal to value."""
+        if self._indexes_stale:
+            # Changes made in a buffered block aren't indexed yet, so scan
+            return any(
+                stamp.unique_id != exclude_id and getattr(stamp, attr) == value
+                for stamp in self._by_id.values()
+            )
+        bucket = index.get(value)
+        if not bucket:
+            return False
+        return len(bucket) > 1 or exclude_id not in bucket
     
     def get_decade_statistics(self) -> dict:
         """
         Get statistics on stamp counts by decade.
         
-        Parses the dates field of each stamp and groups stamps by decade.
-        For year ranges, the mid-year is used to determine the decade.
+        Stamps are grouped by the decade of their dates field, as kept in the
+        decade index. For year ranges, the mid-year is used to determine the decade.
         
         Returns:
             Dictionary mapping decade (e.g., "1840s") to their stamp counts.
             Stamps with unparseable dates are grouped under "Unknown".
         """
-        decade_counts = {}
-        for stamp in self.stamps:
-            year = parse_date_field(stamp.dates)
-            if year is not None:
-                decade = get_decade_from_year(year)
-                decade_label = f"{decade}s"
-                decade_counts[decade_label] = decade_counts.get(decade_label, 0) + 1
-            else:
-                decade_counts["Unknown"] = decade_counts.get("Unknown", 0) + 1
-        return decade_counts
+        # Read from the decade index, so this scales with the number of decades
+        return {format_decade(decade): len(bucket) for decade, bucket in self._by_decade.items()}
+
+
+@lru_cache(maxsize=32)
+def _parse_data_file(file_path: str, mtime_ns: int, size: int):
+    """Parse a JSON data file; cached per path, modification time and size."""
+    if orjson is not None:
+        # orjson's decode error subclasses json.JSONDecodeError, as callers expect
+        with open(file_path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _read_data_file(file_path: str):
+    """
+    Read a JSON data file, reusing the parsed contents until the file changes.
+    
+    The result is shared between calls, so callers must copy it before
+    handing it out.
+    """
+    stat = os.stat(file_path)
+    return _parse_data_file(file_path, stat.st_mtime_ns, stat.st_size)
 
 
 def load_country_names(file_path: Optional[str] = None) -> pd.DataFrame:
@@ -431,10 +958,8 @@ def load_country_names(file_path: Optional[str] = None) -> pd.DataFrame:
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"Country names file not found: {file_path}")
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-    
-    return pd.DataFrame(data)
+    # A fresh DataFrame each call, so callers can modify it freely
+    return pd.DataFrame(_read_data_file(file_path))
 
 
 def load_british_empire_commonwealth(file_path: Optional[str] = None) -> List[str]:
@@ -460,7 +985,22 @@ def load_british_empire_commonwealth(file_path: Optional[str] = None) -> List[st
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"British Empire/Commonwealth file not found: {file_path}")
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    return list(_read_data_file(file_path))
+
+
+def load_british_empire_commonwealth_set(file_path: Optional[str] = None) -> FrozenSet[str]:
+    """
+    Load British Empire and Commonwealth countries as a set for membership tests.
     
-    return data
+    Args:
+        file_path: Path to the british_empire_commonwealth.json file. If None, 
+                   uses default path in the data directory relative to this module.
+    
+    Returns:
+        Frozen set of country names
+    
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    return frozenset(load_british_empire_commonwealth(file_path))
@@ -5,3 +5,25 @@ import os
 os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
 
 import sys
+
+import pytest
+
+ROOT_DIR = os.path.join(os.path.dirname(__file__), '..')
+
+
+def _read_source(file_name: str) -> str:
+    """Read a file from the project root."""
+    with open(os.path.join(ROOT_DIR, file_name), 'r') as f:
+        return f.read()
+
+
+@pytest.fixture(scope="session")
+def view_source():
+    """Source of view.py, read once per test session."""
+    return _read_source('view.py')
+
+
+@pytest.fixture(scope="session")
+def controller_source():
+    """Source of controller.py, read once per test session."""
+    return _read_source('controller.py')
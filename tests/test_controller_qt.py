@@ -0,0 +1,272 @@
+"""
+Tests for StampController paths that need a running Qt event loop:
+debounced auto-saves, background I/O, the close prompt and incremental
+list updates.
+"""
+import pytest
+
+pytest.importorskip("PySide6")
+
+from model import Stamp, StampDatabase
+
+pytestmark = pytest.mark.qt
+
+
+@pytest.fixture
+def controller(qtbot):
+    """A StampController whose window qtbot closes after shutting the controller down."""
+    from controller import StampController
+    
+    ctl = StampController()
+    # qtbot closes its widgets before fixture teardown; shutting down first
+    # stops the window asking about unsaved changes as it closes
+    qtbot.addWidget(ctl.view, before_close_func=lambda view: ctl.shutdown())
+    return ctl
+
+
+@pytest.fixture
+def save_calls(monkeypatch):
+    """Record every StampDatabase.save call, from any thread."""
+    calls = []
+    original_save = StampDatabase.save
+    
+    def recording_save(self, file_path=None):
+        calls.append(file_path)
+        return original_save(self, file_path)
+    
+    monkeypatch.setattr(StampDatabase, "save", recording_save)
+    return calls
+
+
+@pytest.fixture
+def db_path(controller, tmp_path):
+    """Give the controller's database a file to auto-save to."""
+    path = str(tmp_path / "stamps.json")
+    controller.database.file_path = path
+    return path
+
+
+def _saved_names(path):
+    """Load a database file and return its stamp names."""
+    database = StampDatabase()
+    assert database.load(path)
+    return [stamp.name for stamp in database.get_all_stamps()]
+
+
+class TestAutoSave:
+    """Tests for the debounced auto-save."""
+    
+    def test_burst_of_edits_saves_once(self, controller, db_path, save_calls, qtbot):
+        """Test that several edits in quick succession lead to a single write."""
+        controller._autosave_timer.setInterval(50)
+        for name in ("A", "B", "C"):
+            controller.batch_add_stamps([Stamp(name=name)])
+        assert controller._autosave_timer.isActive()
+        
+        qtbot.waitUntil(
+            lambda: not controller.database.is_modified() and controller._autosave_request is None,
+            timeout=3000
+        )
+        # Give a stray second auto-save the chance to show up
+        qtbot.wait(200)
+        assert len(save_calls) == 1
+        assert _saved_names(db_path) == ["A", "B", "C"]
+    
+    def test_shutdown_flushes_pending_autosave(self, controller, db_path, save_calls):
+        """Test that shutdown() writes an auto-save that is still waiting on its timer."""
+        controller.batch_add_stamps([Stamp(name="Penny Black")])
+        assert controller._autosave_timer.isActive()
+        
+        controller.shutdown()
+        
+        assert not controller._autosave_timer.isActive()
+        assert not controller.database.is_modified()
+        assert len(save_calls) == 1
+        assert _saved_names(db_path) == ["Penny Black"]
+    
+    def test_explicit_save_supersedes_pending_autosave(self, controller, db_path, save_calls, qtbot):
+        """Test that no auto-save runs after an explicit save made while the timer was pending."""
+        controller._autosave_timer.setInterval(100)
+        controller.batch_add_stamps([Stamp(name="Penny Black")])
+        assert controller._autosave_timer.isActive()
+        
+        assert controller.save_database()
+        assert not controller.database.is_modified()
+        
+        qtbot.wait(300)
+        assert not controller._autosave_timer.isActive()
+        assert controller._autosave_request is None
+        assert len(save_calls) == 1
+        assert _saved_names(db_path) == ["Penny Black"]
+
+
+class TestBackgroundIO:
+    """Tests for loads and saves run on the I/O thread."""
+    
+    def test_load_swaps_in_new_database(self, controller, tmp_path, qtbot):
+        """Test that a file loaded by the worker replaces the database and fills the list."""
+        path = str(tmp_path / "collection.json")
+        source = StampDatabase()
+        source.add_stamps([Stamp(name="Penny Black"), Stamp(name="Blue Mauritius")])
+        assert source.save(path)
+        old_database = controller.database
+        
+        controller._load_chosen_file(path)
+        qtbot.waitUntil(lambda: controller.database is not old_database, timeout=3000)
+        
+        assert controller.database.file_path == path
+        assert not controller.database.is_modified()
+        # Later saves must go to the new database, not the one replaced
+        assert controller._io_worker.database is controller.database
+        assert controller._progress_dialog is None
+        assert controller.view.stamp_model.rowCount() == 2
+    
+    def test_save_database_returns_worker_result(self, controller, tmp_path, monkeypatch):
+        """Test that save_database() reports the background save's success and failure."""
+        critical = []
+        monkeypatch.setattr("controller.QMessageBox.critical", lambda *args: critical.append(args))
+        controller.database.add_stamp(Stamp(name="Penny Black"))
+        
+        controller.database.file_path = str(tmp_path / "stamps.json")
+        assert controller.save_database() is True
+        assert _saved_names(controller.database.file_path) == ["Penny Black"]
+        assert not critical
+        
+        controller.database.add_stamp(Stamp(name="Blue Mauritius"))
+        controller.database.file_path = str(tmp_path / "missing" / "stamps.json")
+        assert controller.save_database() is False
+        assert controller.database.is_modified()
+        assert len(critical) == 1
+        # The nested wait is torn down either way
+        assert controller._save_loop is None
+        assert controller._save_request is None
+
+
+class TestClosePrompt:
+    """Tests for the unsaved-changes prompt shown when the main window closes."""
+    
+    @pytest.fixture
+    def prompt(self, monkeypatch):
+        """Stand in for the unsaved-changes prompt, recording each question asked."""
+        from controller import QMessageBox
+        
+        class Prompt:
+            reply = QMessageBox.Cancel
+            asked = []
+            
+            @classmethod
+            def question(cls, parent, title, text, buttons):
+                cls.asked.append(text)
+                return cls.reply
+        
+        monkeypatch.setattr(QMessageBox, "question", Prompt.question)
+        return Prompt
+    
+    def test_cancel_keeps_window_open(self, controller, prompt):
+        """Test that cancelling the prompt leaves the window open and the changes unsaved."""
+        controller.view.show()
+        controller.database.add_stamp(Stamp(name="Penny Black"))
+        
+        assert not controller.view.close()
+        
+        assert controller.view.isVisible()
+        assert controller.database.is_modified()
+        assert prompt.asked == ["You have unsaved changes. Do you want to save before closing?"]
+    
+    def test_discarding_changes_closes_window(self, controller, prompt):
+        """Test that answering No closes the window without saving."""
+        from controller import QMessageBox
+        
+        prompt.reply = QMessageBox.No
+        controller.view.show()
+        controller.database.add_stamp(Stamp(name="Penny Black"))
+        
+        assert controller.view.close()
+        assert not controller.view.isVisible()
+        assert len(prompt.asked) == 1
+    
+    def test_saved_database_closes_without_prompt(self, controller, prompt, db_path):
+        """Test that a window with nothing unsaved closes without asking."""
+        controller.view.show()
+        controller.database.add_stamp(Stamp(name="Penny Black"))
+        assert controller.save_database()
+        
+        assert controller.view.close()
+        assert prompt.asked == []
+
+
+class _AcceptingDialog:
+    """Stands in for StampDialog, accepting with fixed stamp data."""
+    
+    def __init__(self, stamp: Stamp):
+        self._stamp = stamp
+    
+    def reset(self, stamp=None):
+        pass
+    
+    def exec(self) -> bool:
+        return True
+    
+    def get_stamp_data(self) -> Stamp:
+        return self._stamp
+
+
+class TestIncrementalListUpdates:
+    """Tests for list diffs applied when the selected filter value disappears."""
+    
+    @pytest.fixture
+    def france_selected(self, controller, qtbot):
+        """Two French stamps and one British, with the France filter applied."""
+        controller.batch_add_stamps([
+            Stamp(unique_id="fr-1", name="Ceres", country="France"),
+            Stamp(unique_id="uk-1", name="Penny Black", country="United Kingdom"),
+            Stamp(unique_id="fr-2", name="Sower", country="France"),
+        ])
+        controller.view.country_filter.setCurrentText("France")
+        qtbot.waitUntil(lambda: self._list_ids(controller) == ["fr-1", "fr-2"], timeout=3000)
+        return controller
+    
+    @staticmethod
+    def _list_ids(controller):
+        """Get the unique_ids shown in the stamp list, in row order."""
+        from PySide6.QtCore import Qt
+        
+        list_model = controller.view.stamp_model
+        return [list_model.data(list_model.index(row), Qt.UserRole) for row in range(list_model.rowCount())]
+    
+    def _wait_for_filter_reset(self, controller, qtbot):
+        """Wait until the country filter falls back to All Countries and the list is rebuilt."""
+        qtbot.waitUntil(
+            lambda: controller.current_filter == "All Countries" and not controller._filter_timer.isActive(),
+            timeout=3000
+        )
+        assert controller.view.country_filter.currentText() == "All Countries"
+    
+    def test_deleting_last_stamp_of_country_resets_filter(self, france_selected, qtbot):
+        """Test that deleting the selected country's last stamp shows all stamps once each."""
+        controller = france_selected
+        controller.delete_stamp("fr-1")
+        assert self._list_ids(controller) == ["fr-2"]
+        
+        controller.delete_stamp("fr-2")
+        self._wait_for_filter_reset(controller, qtbot)
+        
+        assert self._list_ids(controller) == ["uk-1"]
+        assert "France" not in controller.database.get_country_set()
+    
+    def test_editing_last_stamps_out_of_country_lists_each_once(self, france_selected, qtbot):
+        """Test that moving the selected country's stamps elsewhere doesn't duplicate rows."""
+        controller = france_selected
+        controller._edit_dialog = _AcceptingDialog(Stamp(name="Ceres", country="Spain"))
+        controller.edit_stamp("fr-1")
+        controller._edit_dialog = _AcceptingDialog(Stamp(name="Sower", country="United Kingdom"))
+        controller.edit_stamp("fr-2")
+        self._wait_for_filter_reset(controller, qtbot)
+        
+        ids = self._list_ids(controller)
+        assert ids == [stamp.unique_id for stamp in controller.database.get_all_stamps()]
+        assert len(ids) == len(set(ids)) == 3
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -4,7 +4,8 @@ import json
 import tempfile
 import pytest
 import pandas as pd
-from model import load_country_names, load_british_empire_commonwealth
+import model
+from model import load_country_names, load_british_empire_commonwealth, load_british_empire_commonwealth_set
 
 
 class TestCountryNamesLoading:
@@ -131,3 +132,38 @@ class TestBritishEmpireCommonwealthLoading:
                 load_british_empire_commonwealth(temp_path)
         finally:
             os.unlink(temp_path)
+    
+    def test_load_british_empire_commonwealth_returns_fresh_list(self):
+        """Test that modifying a returned list doesn't affect later loads."""
+        countries = load_british_empire_commonwealth()
+        countries.clear()
+        assert 'United Kingdom' in load_british_empire_commonwealth()
+    
+    def test_load_british_empire_commonwealth_rereads_changed_file(self):
+        """Test that a cached file is parsed again after it changes."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8') as f:
+            json.dump(['Country A'], f)
+            temp_path = f.name
+        
+        try:
+            assert load_british_empire_commonwealth(temp_path) == ['Country A']
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(['Country A', 'Country B'], f)
+            assert load_british_empire_commonwealth(temp_path) == ['Country A', 'Country B']
+        finally:
+            os.unlink(temp_path)
+    
+    def test_load_british_empire_commonwealth_set(self):
+        """Test loading British Empire/Commonwealth countries as a frozen set."""
+        countries = load_british_empire_commonwealth_set()
+        assert isinstance(countries, frozenset)
+        assert 'Canada' in countries
+        assert countries == set(load_british_empire_commonwealth())
+    
+    def test_load_british_empire_commonwealth_without_orjson(self, monkeypatch):
+        """Test that the data loaders fall back to the standard json module."""
+        monkeypatch.setattr(model, 'orjson', None)
+        model._parse_data_file.cache_clear()
+        countries = load_british_empire_commonwealth()
+        assert 'Canada' in countries
+        model._parse_data_file.cache_clear()
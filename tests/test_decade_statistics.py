@@ -5,11 +5,9 @@ import pytest
 import os
 
 
-def test_decade_statistics_dialog_exists():
+def test_decade_statistics_dialog_exists(view_source):
     """Test that DecadeStatisticsDialog class exists in view.py."""
-    view_file_path = os.path.join(os.path.dirname(__file__), '..', 'view.py')
-    with open(view_file_path, 'r') as f:
-        content = f.read()
+    content = view_source
     
     # Check for the DecadeStatisticsDialog class
     assert 'class DecadeStatisticsDialog(QDialog):' in content
@@ -17,11 +15,9 @@ def test_decade_statistics_dialog_exists():
     assert 'self.decade_stats = decade_stats or {}' in content
 
 
-def test_decade_statistics_dialog_has_table():
+def test_decade_statistics_dialog_has_table(view_source):
     """Test that DecadeStatisticsDialog has table setup."""
-    view_file_path = os.path.join(os.path.dirname(__file__), '..', 'view.py')
-    with open(view_file_path, 'r') as f:
-        content = f.read()
+    content = view_source
     
     # Check for table implementation
     assert 'table_label = QLabel("Stamps by Decade:")' in content
@@ -29,11 +25,9 @@ def test_decade_statistics_dialog_has_table():
     assert 'self.table.setHorizontalHeaderLabels(["Decade", "Number of Stamps"])' in content
 
 
-def test_decade_statistics_dialog_has_chart():
+def test_decade_statistics_dialog_has_chart(view_source):
     """Test that DecadeStatisticsDialog has bar chart implementation."""
-    view_file_path = os.path.join(os.path.dirname(__file__), '..', 'view.py')
-    with open(view_file_path, 'r') as f:
-        content = f.read()
+    content = view_source
     
     # Check for chart implementation
     assert 'chart_label = QLabel("Bar Chart:")' in content
@@ -45,21 +39,17 @@ def test_decade_statistics_dialog_has_chart():
     assert "ax.set_title('Stamps by Decade')" in content
 
 
-def test_main_window_has_decade_statistics_signal():
+def test_main_window_has_decade_statistics_signal(view_source):
     """Test that MainWindow has decade_statistics_requested signal."""
-    view_file_path = os.path.join(os.path.dirname(__file__), '..', 'view.py')
-    with open(view_file_path, 'r') as f:
-        content = f.read()
+    content = view_source
     
     # Check for signal definition
     assert 'decade_statistics_requested = Signal()' in content
 
 
-def test_main_window_has_decade_statistics_menu():
+def test_main_window_has_decade_statistics_menu(view_source):
     """Test that MainWindow has Stamps by Decade menu item."""
-    view_file_path = os.path.join(os.path.dirname(__file__), '..', 'view.py')
-    with open(view_file_path, 'r') as f:
-        content = f.read()
+    content = view_source
     
     # Check for menu item
     assert 'stamps_by_decade_action = QAction("Stamps by Decade", self)' in content
@@ -67,31 +57,25 @@ def test_main_window_has_decade_statistics_menu():
     assert 'statistics_menu.addAction(stamps_by_decade_action)' in content
 
 
-def test_controller_imports_decade_statistics_dialog():
+def test_controller_imports_decade_statistics_dialog(controller_source):
     """Test that Controller imports DecadeStatisticsDialog."""
-    controller_file_path = os.path.join(os.path.dirname(__file__), '..', 'controller.py')
-    with open(controller_file_path, 'r') as f:
-        content = f.read()
+    content = controller_source
     
     # Check for import
     assert 'DecadeStatisticsDialog' in content
 
 
-def test_controller_connects_decade_statistics_signal():
+def test_controller_connects_decade_statistics_signal(controller_source):
     """Test that Controller connects the decade_statistics_requested signal."""
-    controller_file_path = os.path.join(os.path.dirname(__file__), '..', 'controller.py')
-    with open(controller_file_path, 'r') as f:
-        content = f.read()
+    content = controller_source
     
     # Check for signal connection
     assert 'self.view.decade_statistics_requested.connect(self.show_decade_statistics)' in content
 
 
-def test_controller_has_show_decade_statistics_method():
+def test_controller_has_show_decade_statistics_method(controller_source):
     """Test that Controller has show_decade_statistics method."""
-    controller_file_path = os.path.join(os.path.dirname(__file__), '..', 'controller.py')
-    with open(controller_file_path, 'r') as f:
-        content = f.read()
+    content = controller_source
     
     # Check for method implementation
     assert 'def show_decade_statistics(self):' in content
@@ -110,11 +94,9 @@ def test_matplotlib_added_to_requirements():
     assert 'matplotlib' in content
 
 
-def test_matplotlib_imports_in_view():
+def test_matplotlib_imports_in_view(view_source):
     """Test that matplotlib is imported in view.py."""
-    view_file_path = os.path.join(os.path.dirname(__file__), '..', 'view.py')
-    with open(view_file_path, 'r') as f:
-        content = f.read()
+    content = view_source
     
     # Check for matplotlib imports (using QtAgg backend for Qt5/Qt6 compatibility)
     assert 'import matplotlib' in content
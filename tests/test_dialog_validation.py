@@ -4,19 +4,25 @@ from unittest.mock import Mock, patch, MagicMock
 from model import Stamp, StampDatabase
 
 
+def _build_database():
+    """Create a database with test stamps."""
+    db = StampDatabase()
+    db.add_stamp(Stamp(unique_id="s1", name="Stamp A", image_path="/images/a.jpg"))
+    db.add_stamp(Stamp(unique_id="s2", name="Stamp B", image_path="/images/b.jpg"))
+    return db
+
+
 class TestDialogValidation:
     """Test validation logic that would be in the dialog."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def database(self):
-        """Create a database with test stamps."""
-        db = StampDatabase()
-        db.add_stamp(Stamp(unique_id="s1", name="Stamp A", image_path="/images/a.jpg"))
-        db.add_stamp(Stamp(unique_id="s2", name="Stamp B", image_path="/images/b.jpg"))
-        return db
+        """Shared read-only database; tests that add stamps build their own."""
+        return _build_database()
     
-    def test_adding_new_stamp_with_unique_values(self, database):
+    def test_adding_new_stamp_with_unique_values(self):
         """Test adding a stamp with unique name and image path."""
+        database = _build_database()
         name = "New Stamp"
         image_path = "/images/new.jpg"
         
@@ -76,7 +82,7 @@ class TestDialogValidation:
         assert not database.is_name_in_use("New Name", exclude_id="s1")
         assert not database.is_image_path_in_use("/images/new.jpg", exclude_id="s1")
     
-    def test_empty_name_not_considered_duplicate(self, database):
+    def test_empty_name_not_considered_duplicate(self):
         """Test that empty names are not considered duplicates."""
         db = StampDatabase()
         db.add_stamp(Stamp(name="", image_path="/a.jpg"))
@@ -86,7 +92,7 @@ class TestDialogValidation:
         assert not db.is_name_in_use("")
         assert not db.is_name_in_use("   ")
     
-    def test_empty_image_path_not_considered_duplicate(self, database):
+    def test_empty_image_path_not_considered_duplicate(self):
         """Test that empty image paths are not considered duplicates."""
         db = StampDatabase()
         db.add_stamp(Stamp(name="A", image_path=""))
@@ -3,34 +3,35 @@ Test for filter panel width fix.
 Verifies that the filter panel has adequate width for country names.
 """
 import pytest
-import os
 
 
-def test_filter_panel_width_is_doubled():
-    """Test that filter panel width is 400px (double the original 200px)."""
-    # Since we can't actually import due to Qt dependencies in CI, we'll verify
+@pytest.mark.parametrize("snippet, message", [
+    ('filter_panel = QGroupBox("Filters")',
+     "Filter panel should be created as a QGroupBox"),
+    ('filter_panel.setMaximumWidth(400)',
+     "Filter panel maximum width should be set to 400px (doubled from 200px)"),
+])
+def test_filter_panel_source(view_source, snippet, message):
+    """Test that the filter panel is created with a 400px maximum width."""
+    # Since we can't always import due to Qt dependencies in CI, we verify
     # the code structure by reading the file
-    view_file_path = os.path.join(os.path.dirname(__file__), '..', 'view.py')
-    with open(view_file_path, 'r') as f:
-        content = f.read()
-    
-    # Check that the filter panel maximum width is set to 400
-    assert 'filter_panel.setMaximumWidth(400)' in content, \
-        "Filter panel maximum width should be set to 400px (doubled from 200px)"
+    assert snippet in view_source, message
 
 
-def test_filter_panel_exists():
-    """Test that filter panel is created in the main window."""
-    view_file_path = os.path.join(os.path.dirname(__file__), '..', 'view.py')
-    with open(view_file_path, 'r') as f:
-        content = f.read()
+@pytest.mark.qt
+def test_filter_panel_width_is_doubled(request):
+    """Test that the built filter panel is 400px wide at most (double the original 200px)."""
+    pytest.importorskip("PySide6")
+    # Requested only after the skip, as setting up qtbot needs a Qt binding
+    qtbot = request.getfixturevalue("qtbot")
+    from PySide6.QtWidgets import QGroupBox
+    from view import MainWindow
     
-    # Check for filter panel creation
-    assert 'filter_panel = QGroupBox("Filters")' in content, \
-        "Filter panel should be created as a QGroupBox"
-    assert 'filter_panel.setMaximumWidth' in content, \
-        "Filter panel should have maximum width constraint"
-
+    window = MainWindow()
+    qtbot.addWidget(window)
+    filter_panels = [box for box in window.findChildren(QGroupBox) if box.title() == "Filters"]
+    assert len(filter_panels) == 1
+    assert filter_panels[0].maximumWidth() == 400
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -6,30 +6,33 @@ from model import Stamp, StampDatabase
 class TestDecadeFiltering:
     """Tests for decade filtering logic."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def sample_stamps_with_dates(self):
-        """Create sample stamps with various dates for testing."""
-        return [
+        """Create sample stamps with various dates for testing (shared, not mutated)."""
+        return (
             Stamp(unique_id="s1", name="Stamp1", country="USA", dates="1840"),
             Stamp(unique_id="s2", name="Stamp2", country="UK", dates="1845"),
             Stamp(unique_id="s3", name="Stamp3", country="USA", dates="1850-1860"),
             Stamp(unique_id="s4", name="Stamp4", country="Canada", dates="1860"),
             Stamp(unique_id="s5", name="Stamp5", country="France", dates="unknown"),
             Stamp(unique_id="s6", name="Stamp6", country="Germany", dates="circa 1870"),
-        ]
+        )
     
-    def test_filter_by_decade_1840s(self, sample_stamps_with_dates):
+    @pytest.fixture(scope="module")
+    def filter_db(self, sample_stamps_with_dates):
+        """Database of the sample stamps, shared by the read-only filter tests."""
+        db = StampDatabase()
+        db.add_stamps(sample_stamps_with_dates)
+        return db
+    
+    def test_filter_by_decade_1840s(self, filter_db):
         """Test filtering by 1840s decade."""
         from model import parse_date_field, get_decade_from_year
         
-        db = StampDatabase()
-        for stamp in sample_stamps_with_dates:
-            db.add_stamp(stamp)
-        
         # Filter for 1840s
         filter_decade = 1840
         filtered = []
-        for stamp in db.get_all_stamps():
+        for stamp in filter_db.get_all_stamps():
             year = parse_date_field(stamp.dates)
             if year is not None:
                 stamp_decade = get_decade_from_year(year)
@@ -39,18 +42,14 @@ class TestDecadeFiltering:
         assert len(filtered) == 2
         assert all(stamp.unique_id in ["s1", "s2"] for stamp in filtered)
     
-    def test_filter_by_decade_1850s(self, sample_stamps_with_dates):
+    def test_filter_by_decade_1850s(self, filter_db):
         """Test filtering by 1850s decade - includes range that spans into 1850s."""
         from model import parse_date_field, get_decade_from_year
         
-        db = StampDatabase()
-        for stamp in sample_stamps_with_dates:
-            db.add_stamp(stamp)
-        
         # Filter for 1850s (stamp with range "1850-1860" should match as midpoint is 1855)
         filter_decade = 1850
         filtered = []
-        for stamp in db.get_all_stamps():
+        for stamp in filter_db.get_all_stamps():
             year = parse_date_field(stamp.dates)
             if year is not None:
                 stamp_decade = get_decade_from_year(year)
@@ -60,17 +59,13 @@ class TestDecadeFiltering:
         assert len(filtered) == 1
         assert filtered[0].unique_id == "s3"
     
-    def test_filter_by_decade_unknown(self, sample_stamps_with_dates):
+    def test_filter_by_decade_unknown(self, filter_db):
         """Test filtering for stamps with unknown/unparseable dates."""
         from model import parse_date_field
         
-        db = StampDatabase()
-        for stamp in sample_stamps_with_dates:
-            db.add_stamp(stamp)
-        
         # Filter for Unknown
         filtered = []
-        for stamp in db.get_all_stamps():
+        for stamp in filter_db.get_all_stamps():
             year = parse_date_field(stamp.dates)
             if year is None:
                 filtered.append(stamp)
@@ -78,18 +73,14 @@ class TestDecadeFiltering:
         assert len(filtered) == 1
         assert filtered[0].unique_id == "s5"
     
-    def test_filter_by_decade_with_circa(self, sample_stamps_with_dates):
+    def test_filter_by_decade_with_circa(self, filter_db):
         """Test that circa dates are properly filtered."""
         from model import parse_date_field, get_decade_from_year
         
-        db = StampDatabase()
-        for stamp in sample_stamps_with_dates:
-            db.add_stamp(stamp)
-        
         # Filter for 1870s
         filter_decade = 1870
         filtered = []
-        for stamp in db.get_all_stamps():
+        for stamp in filter_db.get_all_stamps():
             year = parse_date_field(stamp.dates)
             if year is not None:
                 stamp_decade = get_decade_from_year(year)
@@ -99,20 +90,16 @@ class TestDecadeFiltering:
         assert len(filtered) == 1
         assert filtered[0].unique_id == "s6"
     
-    def test_combined_country_and_decade_filter(self, sample_stamps_with_dates):
+    def test_combined_country_and_decade_filter(self, filter_db):
         """Test combining country and decade filters."""
         from model import parse_date_field, get_decade_from_year
         
-        db = StampDatabase()
-        for stamp in sample_stamps_with_dates:
-            db.add_stamp(stamp)
-        
         # Filter for USA and 1840s
         country_filter = "USA"
         decade_filter = 1840
         
         filtered = []
-        for stamp in db.get_all_stamps():
+        for stamp in filter_db.get_all_stamps():
             # Apply country filter
             if stamp.country != country_filter:
                 continue
@@ -143,6 +130,17 @@ class TestDecadeFiltering:
         
         assert len(filtered) == 1
         assert filtered[0].name == "S1"
+    
+    @pytest.mark.parametrize("decade, expected_ids", [
+        ("1840s", ["s1", "s2"]),
+        ("1850s", ["s3"]),
+        ("1860s", ["s4"]),
+        ("1870s", ["s6"]),
+        ("Unknown", ["s5"]),
+    ])
+    def test_decade_index_matches_parsed_filter(self, filter_db, decade, expected_ids):
+        """Test that the indexed decade lookup agrees with parsing each stamp's dates."""
+        assert [s.unique_id for s in filter_db.get_stamps_by_decade(decade)] == expected_ids
 
 
 class TestFilterViewIntegration:
@@ -1,8 +1,6 @@
 """Unit tests for keywords field in Stamp model."""
 import pytest
 from model import Stamp, StampDatabase
-import tempfile
-import os
 
 
 class TestKeywordsField:
@@ -65,7 +63,7 @@ class TestKeywordsField:
         stamp = Stamp.from_dict(stamp_dict)
         assert stamp.keywords == ""
     
-    def test_keywords_persistence_in_database(self):
+    def test_keywords_persistence_in_database(self, tmp_path):
         """Test that keywords are persisted when saving to and loading from database."""
         # Create a database with a stamp that has keywords
         db = StampDatabase()
@@ -83,29 +81,22 @@ class TestKeywordsField:
         db.add_stamp(stamp2)
         
         # Save to a temporary file
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            temp_file = f.name
+        temp_file = str(tmp_path / "keywords.json")
+        db.save(temp_file)
         
-        try:
-            db.save(temp_file)
-            
-            # Load from the file into a new database
-            new_db = StampDatabase()
-            new_db.load(temp_file)
-            
-            # Verify keywords are preserved
-            loaded_stamps = new_db.get_all_stamps()
-            assert len(loaded_stamps) == 2
-            
-            penny_black = next(s for s in loaded_stamps if s.name == "Penny Black")
-            assert penny_black.keywords == "first, adhesive, postage"
-            
-            blue_mauritius = next(s for s in loaded_stamps if s.name == "Blue Mauritius")
-            assert blue_mauritius.keywords == "rare, valuable, blue"
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+        # Load from the file into a new database
+        new_db = StampDatabase()
+        new_db.load(temp_file)
+        
+        # Verify keywords are preserved
+        loaded_stamps = new_db.get_all_stamps()
+        assert len(loaded_stamps) == 2
+        
+        [penny_black] = new_db.get_stamps_by_name("Penny Black")
+        assert penny_black.keywords == "first, adhesive, postage"
+        
+        [blue_mauritius] = new_db.get_stamps_by_name("Blue Mauritius")
+        assert blue_mauritius.keywords == "rare, valuable, blue"
     
     def test_update_stamp_keywords(self):
         """Test updating a stamp's keywords."""
@@ -135,7 +126,7 @@ class TestKeywordsField:
         retrieved = db.get_stamp(stamp.unique_id)
         assert retrieved.keywords == ""
     
-    def test_keywords_with_special_characters(self):
+    def test_keywords_with_special_characters(self, tmp_path):
         """Test that keywords with special characters are handled correctly."""
         stamp = Stamp(
             name="Test",
@@ -146,16 +137,10 @@ class TestKeywordsField:
         db.add_stamp(stamp)
         
         # Save and load
-        with tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json') as f:
-            temp_file = f.name
+        temp_file = str(tmp_path / "keywords.json")
+        db.save(temp_file)
+        new_db = StampDatabase()
+        new_db.load(temp_file)
         
-        try:
-            db.save(temp_file)
-            new_db = StampDatabase()
-            new_db.load(temp_file)
-            
-            loaded_stamp = new_db.get_stamp(stamp.unique_id)
-            assert loaded_stamp.keywords == "vintage, 1940's, World War II, rare & valuable"
-        finally:
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+        loaded_stamp = new_db.get_stamp(stamp.unique_id)
+        assert loaded_stamp.keywords == "vintage, 1940's, World War II, rare & valuable"
@@ -1,9 +1,10 @@
 """Unit tests for the model module."""
 import json
 import os
-import tempfile
+from datetime import datetime, timezone
 import pytest
-from model import Stamp, StampDatabase, parse_date_field, get_decade_from_year, parse_decade_string
+import model
+from model import Stamp, StampDatabase, parse_date_field, get_decade_from_year, parse_decade_string, format_decade
 
 
 class TestDateParsing:
@@ -59,6 +60,22 @@ class TestDateParsing:
         assert parse_date_field("  1840-1850  ") == 1845
         assert parse_date_field("  circa 1840  ") == 1840
     
+    def test_parse_fast_path_rejects_non_year_digits(self):
+        """Test that four-character inputs which only look numeric aren't parsed as years."""
+        assert parse_date_field("²²²²") is None
+        assert parse_date_field("184a") is None
+        assert parse_date_field("1840-185x") is None
+        assert parse_date_field("1840/1850") is None
+    
+    def test_parse_date_field_caches_repeated_dates(self):
+        """Test that repeated date strings are parsed once and served from the cache."""
+        model.DateUtils._parse_date_text.cache_clear()
+        assert parse_date_field("circa 1840") == 1840
+        assert parse_date_field("circa 1840") == 1840
+        info = model.DateUtils._parse_date_text.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+    
     def test_get_decade_from_year(self):
         """Test getting decade from year."""
         assert get_decade_from_year(1840) == 1840
@@ -85,6 +102,13 @@ class TestDateParsing:
         # Invalid strings should return None
         assert parse_decade_string("invalid") is None
         assert parse_decade_string("") is None
+    
+    def test_format_decade(self):
+        """Test formatting numeric decades as decade strings."""
+        assert format_decade(1840) == "1840s"
+        assert format_decade(2020) == "2020s"
+        assert format_decade(None) == "Unknown"
+        assert parse_decade_string(format_decade(1990)) == 1990
 
 
 class TestStamp:
@@ -133,6 +157,13 @@ class TestStamp:
         assert 'image_path' in stamp_dict
         assert 'dates' in stamp_dict
     
+    def test_stamp_to_dict_covers_all_fields(self):
+        """Test that to_dict includes every constructor field."""
+        from dataclasses import fields
+        
+        init_fields = [f.name for f in fields(Stamp) if f.init]
+        assert list(Stamp().to_dict()) == init_fields
+    
     def test_stamp_from_dict(self):
         """Test creating stamp from dictionary."""
         data = {
@@ -164,6 +195,41 @@ class TestStamp:
         assert stamp1.unique_id != ""
         assert stamp2.unique_id != ""
         assert stamp1.unique_id != stamp2.unique_id
+    
+    def test_generated_unique_id_format(self):
+        """Test that generated IDs are 32 lowercase hex characters."""
+        unique_id = Stamp().unique_id
+        assert len(unique_id) == 32
+        assert int(unique_id, 16) >= 0
+        assert unique_id == unique_id.lower()
+    
+    def test_stamp_year_is_cached_and_follows_dates(self):
+        """Test that year() parses dates once and re-parses after a change."""
+        stamp = Stamp(dates="1850-1860")
+        assert stamp.year() == 1855
+        assert stamp.year() == 1855
+        
+        stamp.dates = "circa 1901"
+        assert stamp.year() == 1901
+        
+        stamp.dates = "unknown"
+        assert stamp.year() is None
+    
+    def test_stamp_to_dict_excludes_year_cache(self):
+        """Test that the cached year is not serialized."""
+        stamp = Stamp(unique_id="test-789", dates="1840")
+        stamp.year()
+        
+        stamp_dict = stamp.to_dict()
+        assert '_year_cache' not in stamp_dict
+        assert Stamp.from_dict(stamp_dict) == stamp
+    
+    def test_stamp_uses_slots(self):
+        """Test that stamps store fields in slots rather than a per-instance dict."""
+        stamp = Stamp(name="Penny Black")
+        assert not hasattr(stamp, '__dict__')
+        with pytest.raises(AttributeError):
+            stamp.nmae = "Typo"
 
 
 class TestStampDatabase:
@@ -175,14 +241,11 @@ class TestStampDatabase:
         return StampDatabase()
     
     @pytest.fixture
-    def temp_json_file(self):
-        """Create a temporary JSON file for testing."""
-        fd, path = tempfile.mkstemp(suffix='.json')
-        os.close(fd)
-        yield path
-        # Cleanup
-        if os.path.exists(path):
-            os.remove(path)
+    def temp_json_file(self, tmp_path):
+        """Path to an empty temporary JSON file; pytest removes it with tmp_path."""
+        path = tmp_path / "stamps.json"
+        path.touch()
+        return str(path)
     
     @pytest.fixture
     def sample_stamps(self):
@@ -228,8 +291,7 @@ class TestStampDatabase:
     
     def test_get_stamp(self, db, sample_stamps):
         """Test retrieving a stamp by ID."""
-        for stamp in sample_stamps:
-            db.add_stamp(stamp)
+        db.add_stamps(sample_stamps)
         
         stamp = db.get_stamp("stamp-001")
         assert stamp is not None
@@ -246,8 +308,7 @@ class TestStampDatabase:
     
     def test_get_all_stamps(self, db, sample_stamps):
         """Test getting all stamps."""
-        for stamp in sample_stamps:
-            db.add_stamp(stamp)
+        db.add_stamps(sample_stamps)
         
         all_stamps = db.get_all_stamps()
         assert len(all_stamps) == 2
@@ -285,8 +346,7 @@ class TestStampDatabase:
     
     def test_delete_stamp(self, db, sample_stamps):
         """Test deleting a stamp."""
-        for stamp in sample_stamps:
-            db.add_stamp(stamp)
+        db.add_stamps(sample_stamps)
         
         result = db.delete_stamp("stamp-001")
         
@@ -302,8 +362,7 @@ class TestStampDatabase:
     
     def test_clear(self, db, sample_stamps):
         """Test clearing the database."""
-        for stamp in sample_stamps:
-            db.add_stamp(stamp)
+        db.add_stamps(sample_stamps)
         
         db.file_path = "test.json"
         db.clear()
@@ -314,8 +373,7 @@ class TestStampDatabase:
     
     def test_save_new_file(self, db, temp_json_file, sample_stamps):
         """Test saving database to a new file."""
-        for stamp in sample_stamps:
-            db.add_stamp(stamp)
+        db.add_stamps(sample_stamps)
         
         result = db.save(temp_json_file)
         
@@ -371,8 +429,7 @@ class TestStampDatabase:
         """Test loading an existing database file."""
         # First save some stamps
         db1 = StampDatabase()
-        for stamp in sample_stamps:
-            db1.add_stamp(stamp)
+        db1.add_stamps(sample_stamps)
         db1.save(temp_json_file)
         
         # Load into new database
@@ -418,8 +475,7 @@ class TestStampDatabase:
     
     def test_save_preserves_metadata(self, db, temp_json_file, sample_stamps):
         """Test that saving includes metadata."""
-        for stamp in sample_stamps:
-            db.add_stamp(stamp)
+        db.add_stamps(sample_stamps)
         db.save(temp_json_file)
         
         with open(temp_json_file, 'r') as f:
@@ -430,45 +486,354 @@ class TestStampDatabase:
         assert 'last_modified' in data['metadata']
         assert data['metadata']['version'] == '1.0'
     
-    def test_get_country_statistics_empty(self, db):
-        """Test getting country statistics from empty database."""
-        stats = db.get_country_statistics()
-        assert stats == {}
+    @pytest.mark.parametrize('encoder', ['orjson', 'ujson', 'json'])
+    def test_save_metadata_timestamp_is_utc(self, db, temp_json_file, monkeypatch, encoder):
+        """Test that last_modified is written as an ISO-8601 UTC time with every encoder."""
+        if encoder != 'orjson':
+            monkeypatch.setattr(model, 'orjson', None)
+        if encoder == 'ujson':
+            monkeypatch.setattr(model, 'ujson', pytest.importorskip('ujson', minversion='5.4'))
+        elif encoder == 'json':
+            monkeypatch.setattr(model, 'ujson', None)
+        assert db.save(temp_json_file)
+        db2 = StampDatabase()
+        assert db2.load(temp_json_file)
+        
+        with open(temp_json_file, 'r') as f:
+            last_modified = json.load(f)['metadata']['last_modified']
+        assert last_modified.endswith('Z')
+        parsed = datetime.fromisoformat(last_modified[:-1] + '+00:00')
+        assert abs((datetime.now(timezone.utc) - parsed).total_seconds()) < 60
+    
+    def test_save_writes_compact_json(self, db, temp_json_file, sample_stamps):
+        """Test that the database is saved without indentation whitespace."""
+        db.add_stamps(sample_stamps)
+        db.save(temp_json_file)
+        
+        with open(temp_json_file, 'rb') as f:
+            raw = f.read()
+        
+        assert b'\n' not in raw
+        assert b'": "' not in raw
+        assert json.loads(raw)['stamps'][0]['name'] == "Penny Black"
+    
+    def test_save_and_load_without_orjson(self, db, temp_json_file, sample_stamps, monkeypatch):
+        """Test that the stdlib json fallback is used when orjson and ujson are unavailable."""
+        monkeypatch.setattr(model, 'orjson', None)
+        monkeypatch.setattr(model, 'ujson', None)
+        
+        db.add_stamps(sample_stamps)
+        db.stamps[0].comments = "Café – ünïcode"
+        assert db.save(temp_json_file)
+        
+        db2 = StampDatabase()
+        assert db2.load(temp_json_file)
+        assert len(db2.stamps) == 2
+        assert db2.stamps[0].comments == "Café – ünïcode"
+        assert db2.stamps[1].name == "Blue Mauritius"
+    
+    def test_save_keeps_changes_made_during_save_modified(self, db, temp_json_file, sample_stamps, monkeypatch):
+        """Test that edits made while a save is writing keep the database modified."""
+        db.add_stamp(sample_stamps[0])
+        write = model._write_database
+        
+        def write_and_edit(f, stamps, metadata, compressed):
+            # Simulate the GUI thread editing while the I/O thread saves
+            db.add_stamp(sample_stamps[1])
+            write(f, stamps, metadata, compressed)
+        
+        monkeypatch.setattr(model, '_write_database', write_and_edit)
+        assert db.save(temp_json_file)
+        assert db.is_modified()
+        
+        db2 = StampDatabase()
+        assert db2.load(temp_json_file)
+        assert len(db2.stamps) == 1
+    
+    def test_save_does_not_restore_path_after_clear(self, db, temp_json_file, sample_stamps, monkeypatch):
+        """Test that clearing during a save leaves the database without a file path."""
+        db.add_stamp(sample_stamps[0])
+        db.file_path = temp_json_file
+        write = model._write_database
+        
+        def write_and_clear(f, stamps, metadata, compressed):
+            db.clear()
+            write(f, stamps, metadata, compressed)
+        
+        monkeypatch.setattr(model, '_write_database', write_and_clear)
+        assert db.save()
+        assert db.file_path is None
+        assert not db.is_modified()
+    
+    @pytest.mark.parametrize('file_name', ['stamps.json', 'stamps.scdb'])
+    def test_streamed_save_spans_batches(self, db, tmp_path, monkeypatch, file_name):
+        """Test that a save streamed in several batches is a single valid document."""
+        monkeypatch.setattr(model, '_STREAM_BATCH_SIZE', 3)
+        for i in range(7):
+            db.add_stamp(Stamp(name=f"Stamp {i}", country="UK"))
+        path = str(tmp_path / file_name)
+        assert db.save(path)
+        
+        db2 = StampDatabase()
+        assert db2.load(path)
+        assert [s.name for s in db2.stamps] == [f"Stamp {i}" for i in range(7)]
+    
+    def test_save_empty_database(self, db, temp_json_file):
+        """Test that an empty database streams a valid document."""
+        assert db.save(temp_json_file)
+        with open(temp_json_file, encoding='utf-8') as f:
+            data = json.load(f)
+        assert data['stamps'] == []
+        assert data['metadata']['version'] == '1.0'
+    
+    @pytest.mark.parametrize('file_name', ['stamps.msgpack', 'stamps.mpk'])
+    def test_save_and_load_msgpack(self, db, tmp_path, sample_stamps, file_name):
+        """Test that .msgpack/.mpk files round-trip through MessagePack."""
+        msgpack = pytest.importorskip('msgpack')
+        db.add_stamps(sample_stamps)
+        path = str(tmp_path / file_name)
+        assert db.save(path)
+        
+        with open(path, 'rb') as f:
+            data = msgpack.unpackb(f.read(), raw=False)
+        assert data['metadata']['version'] == '1.0'
+        
+        db2 = StampDatabase()
+        assert db2.load(path)
+        assert [s.to_dict() for s in db2.stamps] == [s.to_dict() for s in db.stamps]
     
-    def test_get_country_statistics(self, db):
+    def test_msgpack_unavailable(self, db, tmp_path, sample_stamps, monkeypatch):
+        """Test that binary saves and loads fail cleanly without msgpack."""
+        monkeypatch.setattr(model, 'msgpack', None)
+        db.add_stamp(sample_stamps[0])
+        path = tmp_path / "stamps.msgpack"
+        assert not db.save(str(path))
+        assert not path.exists()
+        assert db.is_modified()
+        
+        path.write_bytes(b'\x80')
+        assert not StampDatabase().load(str(path))
+    
+    def test_failed_save_keeps_previous_file(self, db, temp_json_file, sample_stamps, monkeypatch):
+        """Test that an error while writing leaves the old file intact and no temp file."""
+        db.add_stamp(sample_stamps[0])
+        assert db.save(temp_json_file)
+        
+        def write_and_fail(f, stamps, metadata, compressed):
+            f.write(b'{"stamps":[')
+            raise OSError("disk full")
+        
+        monkeypatch.setattr(model, '_write_database', write_and_fail)
+        db.add_stamp(sample_stamps[1])
+        assert not db.save(temp_json_file)
+        assert db.is_modified()
+        assert not os.path.exists(temp_json_file + '.tmp')
+        
+        db2 = StampDatabase()
+        assert db2.load(temp_json_file)
+        assert len(db2.stamps) == 1
+    
+    def test_save_and_load_with_ujson(self, db, temp_json_file, sample_stamps, monkeypatch):
+        """Test that ujson is used as a fallback when orjson is unavailable."""
+        pytest.importorskip('ujson')
+        monkeypatch.setattr(model, 'orjson', None)
+        
+        db.add_stamps(sample_stamps)
+        db.stamps[0].image_path = "/images/café.png"
+        assert db.save(temp_json_file)
+        
+        with open(temp_json_file, 'rb') as f:
+            raw = f.read()
+        assert b'/images/caf\xc3\xa9.png' in raw
+        
+        db2 = StampDatabase()
+        assert db2.load(temp_json_file)
+        assert [s.to_dict() for s in db2.stamps] == [s.to_dict() for s in db.stamps]
+    
+    def test_save_and_load_compressed(self, db, sample_stamps, tmp_path):
+        """Test that .scdb files are written compressed and load back."""
+        scdb_path = str(tmp_path / "stamps.scdb")
+        db.add_stamps(sample_stamps)
+        assert db.save(scdb_path)
+        
+        with open(scdb_path, 'rb') as f:
+            raw = f.read()
+        assert raw.startswith(b'SCDB')
+        assert b'Penny Black' not in raw
+        
+        db2 = StampDatabase()
+        assert db2.load(scdb_path)
+        assert [s.to_dict() for s in db2.stamps] == [s.to_dict() for s in sample_stamps]
+    
+    @pytest.mark.parametrize("countries, expected", [
+        ([], {}),
+        (
+            ["United Kingdom", "United Kingdom", "France", "Germany", "France"],
+            {"United Kingdom": 2, "France": 2, "Germany": 1},
+        ),
+        # Blank countries are counted as Unknown
+        (["France", "", "   ", "France"], {"France": 2, "Unknown": 2}),
+    ], ids=["empty", "counts", "blank-countries"])
+    def test_get_country_statistics(self, db, countries, expected):
         """Test getting country statistics."""
-        stamps = [
-            Stamp(name="Stamp 1", country="United Kingdom"),
-            Stamp(name="Stamp 2", country="United Kingdom"),
-            Stamp(name="Stamp 3", country="France"),
-            Stamp(name="Stamp 4", country="Germany"),
-            Stamp(name="Stamp 5", country="France"),
-        ]
-        for stamp in stamps:
-            db.add_stamp(stamp)
+        db.add_stamps(Stamp(name=f"Stamp {i}", country=country) for i, country in enumerate(countries))
+        assert db.get_country_statistics() == expected
+    
+    def test_get_country_statistics_tracks_changes(self, db):
+        """Test that country statistics follow updates and deletions."""
+        db.add_stamp(Stamp(unique_id="s1", name="Stamp 1", country="France"))
+        db.add_stamp(Stamp(unique_id="s2", name="Stamp 2", country="France"))
+        db.add_stamp(Stamp(unique_id="s3", name="Stamp 3", country=""))
         
-        stats = db.get_country_statistics()
+        db.update_stamp("s2", Stamp(name="Stamp 2", country="Spain"))
+        db.update_stamp("s3", Stamp(name="Stamp 3", country="Spain"))
+        assert db.get_country_statistics() == {"France": 1, "Spain": 2}
         
-        assert len(stats) == 3
-        assert stats["United Kingdom"] == 2
-        assert stats["France"] == 2
-        assert stats["Germany"] == 1
+        db.delete_stamp("s1")
+        assert db.get_country_statistics() == {"Spain": 2}
     
-    def test_get_country_statistics_with_empty_country(self, db):
-        """Test country statistics with empty country names."""
-        stamps = [
-            Stamp(name="Stamp 1", country="France"),
-            Stamp(name="Stamp 2", country=""),
-            Stamp(name="Stamp 3", country="   "),
-            Stamp(name="Stamp 4", country="France"),
-        ]
-        for stamp in stamps:
-            db.add_stamp(stamp)
+    def test_buffered_defers_index_updates(self, db, sample_stamps):
+        """Test that buffered() rebuilds the indexes once on exit."""
+        db.add_stamp(sample_stamps[0])
+        with db.buffered():
+            db.add_stamp(sample_stamps[1])
+            db.update_stamp("stamp-001", Stamp(name="Moved", country="France"))
+            with db.buffered():
+                db.add_stamp(Stamp(unique_id="stamp-003", name="Jenny", country="USA"))
+            # Still inside the outer block, so the index is not rebuilt yet
+            assert db.get_country_set() == {"United Kingdom"}
+        
+        assert db.get_country_set() == {"France", "Mauritius", "USA"}
+        assert [s.unique_id for s in db.get_stamps_by_country("France")] == ["stamp-001"]
+        assert db.get_total_count() == 3
+        assert db.is_modified()
+    
+    def test_add_stamps_indexes_the_batch(self, db, sample_stamps):
+        """Test that add_stamps() adds in order and leaves the indexes current."""
+        db.add_stamp(Stamp(unique_id="stamp-001", name="Existing", country="France"))
+        db.add_stamps(sample_stamps)
         
-        stats = db.get_country_statistics()
+        ids = [s.unique_id for s in db.get_all_stamps()]
+        assert ids[0] == "stamp-001" and ids[2] == "stamp-002"
+        assert ids[1] != "stamp-001"  # duplicate ID replaced
+        assert db.get_country_set() == {"France", "United Kingdom", "Mauritius"}
+        assert db.is_name_in_use(sample_stamps[1].name)
+        assert db.is_modified()
+    
+    def test_update_keeps_collection_order(self, db, sample_stamps):
+        """Test that updating a stamp keeps its position in the collection."""
+        db.add_stamps(sample_stamps)
         
-        assert stats["France"] == 2
-        assert stats["Unknown"] == 2
+        db.update_stamp("stamp-001", Stamp(name="Updated"))
+        assert [s.unique_id for s in db.get_all_stamps()] == ["stamp-001", "stamp-002"]
+        assert db.get_stamp("stamp-001").name == "Updated"
+    
+    def test_duplicate_ids_are_replaced(self, db, temp_json_file):
+        """Test that stamps with an ID already in use get a new one."""
+        db.add_stamp(Stamp(unique_id="dup", name="First"))
+        db.add_stamp(Stamp(unique_id="dup", name="Second"))
+        assert db.get_total_count() == 2
+        assert db.get_stamp("dup").name == "First"
+        
+        with open(temp_json_file, 'w') as f:
+            json.dump({'stamps': [{'unique_id': 'dup', 'name': 'A'}, {'unique_id': 'dup', 'name': 'B'}]}, f)
+        assert db.load(temp_json_file)
+        assert [s.name for s in db.stamps] == ["A", "B"]
+        assert len({s.unique_id for s in db.stamps}) == 2
+    
+    def test_load_with_duplicate_ids_marks_modified(self, db, temp_json_file, capsys):
+        """Test that IDs rewritten on load are reported and kept once saved."""
+        with open(temp_json_file, 'w') as f:
+            json.dump({'stamps': [{'unique_id': 'dup', 'name': 'A'}, {'unique_id': 'dup', 'name': 'B'}]}, f)
+        assert db.load(temp_json_file)
+        assert db.is_modified()
+        assert "duplicate IDs" in capsys.readouterr().out
+        ids = [s.unique_id for s in db.stamps]
+        assert ids[0] == "dup" and ids[1] != "dup"
+        
+        assert db.save()
+        reloaded = StampDatabase()
+        assert reloaded.load(temp_json_file)
+        assert [s.unique_id for s in reloaded.stamps] == ids
+        assert not reloaded.is_modified()
+    
+    def test_get_country_set_tracks_changes(self, db, sample_stamps):
+        """Test that the country index follows add, update, delete and clear."""
+        assert db.get_country_set() == set()
+        
+        db.add_stamps(sample_stamps)
+        db.add_stamp(Stamp(unique_id="blank", name="No Country", country="   "))
+        assert db.get_country_set() == {"United Kingdom", "Mauritius"}
+        
+        db.update_stamp("stamp-002", Stamp(name="Moved", country="France"))
+        assert db.get_country_set() == {"United Kingdom", "France"}
+        
+        # Editing the stored object in place is also picked up
+        stamp = db.get_stamp("stamp-001")
+        stamp.country = "UK"
+        db.update_stamp("stamp-001", stamp)
+        assert db.get_country_set() == {"UK", "France"}
+        
+        db.delete_stamp("stamp-002")
+        assert db.get_country_set() == {"UK"}
+        
+        db.clear()
+        assert db.get_country_set() == set()
+    
+    def test_get_stamps_by_country(self, db, sample_stamps):
+        """Test that the country index returns the matching stamps."""
+        db.add_stamps(sample_stamps)
+        
+        uk_stamps = db.get_stamps_by_country("United Kingdom")
+        assert [s.unique_id for s in uk_stamps] == ["stamp-001"]
+        assert db.get_stamps_by_country("France") == []
+        
+        # Updates move stamps between countries
+        db.update_stamp("stamp-002", Stamp(name="Moved", country="United Kingdom"))
+        uk_ids = [s.unique_id for s in db.get_stamps_by_country("United Kingdom")]
+        assert sorted(uk_ids) == ["stamp-001", "stamp-002"]
+        assert db.get_stamps_by_country("Mauritius") == []
+        
+        db.delete_stamp("stamp-001")
+        assert [s.name for s in db.get_stamps_by_country("United Kingdom")] == ["Moved"]
+    
+    @pytest.mark.parametrize("in_place", [False, True], ids=["replaced", "in-place"])
+    def test_country_change_keeps_collection_order(self, db, in_place):
+        """Test that a stamp moved to another country keeps its collection-order place there."""
+        db.add_stamps([
+            Stamp(unique_id="a", name="A", country="France"),
+            Stamp(unique_id="b", name="B", country="United Kingdom"),
+            Stamp(unique_id="c", name="C", country="United Kingdom"),
+            Stamp(unique_id="d", name="D", country="France"),
+        ])
+        
+        if in_place:
+            stamp = db.get_stamp("a")
+            stamp.country = "United Kingdom"
+        else:
+            stamp = Stamp(name="A", country="United Kingdom")
+        db.update_stamp("a", stamp)
+        
+        for country in ("United Kingdom", "France"):
+            expected = [s.unique_id for s in db.get_all_stamps() if s.country == country]
+            assert [s.unique_id for s in db.get_stamps_by_country(country)] == expected
+        assert [s.unique_id for s in db.get_stamps_by_country("United Kingdom")] == ["a", "b", "c"]
+        
+        # Moving back and adding afterwards still follows collection order
+        db.update_stamp("c", Stamp(name="C", country="France"))
+        db.add_stamp(Stamp(unique_id="e", name="E", country="France"))
+        assert [s.unique_id for s in db.get_stamps_by_country("France")] == ["c", "d", "e"]
+    
+    def test_get_stamps_by_name(self, db, sample_stamps):
+        """Test that the name index returns the matching stamps."""
+        db.add_stamps(sample_stamps)
+        
+        assert [s.unique_id for s in db.get_stamps_by_name("Penny Black")] == ["stamp-001"]
+        assert db.get_stamps_by_name("Inverted Jenny") == []
+        
+        db.update_stamp("stamp-002", Stamp(name="Penny Black"))
+        assert [s.unique_id for s in db.get_stamps_by_name("Penny Black")] == ["stamp-001", "stamp-002"]
+        assert db.get_stamps_by_name("Blue Mauritius") == []
     
     def test_get_total_count(self, db, sample_stamps):
         """Test getting total stamp count."""
@@ -524,6 +889,87 @@ class TestStampDatabase:
         assert stats["1840s"] == 2
         assert stats["Unknown"] == 2
     
+    def test_get_decade_statistics_tracks_changes(self, db):
+        """Test that decade statistics follow updates and deletions."""
+        db.add_stamp(Stamp(unique_id="s1", name="Stamp 1", dates="1840"))
+        db.add_stamp(Stamp(unique_id="s2", name="Stamp 2", dates="1845"))
+        db.add_stamp(Stamp(unique_id="s3", name="Stamp 3", dates="unknown"))
+        
+        db.update_stamp("s2", Stamp(name="Stamp 2", dates="1901"))
+        db.update_stamp("s3", Stamp(name="Stamp 3", dates="1905"))
+        assert db.get_decade_statistics() == {"1840s": 1, "1900s": 2}
+        
+        # Editing the stored object in place is also picked up
+        stamp = db.get_stamp("s1")
+        stamp.dates = "circa 1850"
+        db.update_stamp("s1", stamp)
+        assert db.get_decade_statistics() == {"1850s": 1, "1900s": 2}
+        
+        db.delete_stamp("s2")
+        db.delete_stamp("s3")
+        assert db.get_decade_statistics() == {"1850s": 1}
+    
+    def test_in_place_edit_leaves_no_stale_index_entries(self, db, sample_stamps):
+        """Test that a stamp edited in place is moved out of the buckets it was indexed under."""
+        db.add_stamps(sample_stamps)
+        
+        stamp = db.get_stamp("stamp-001")
+        stamp.name = "Penny Red"
+        stamp.image_path = "/images/red.jpg"
+        stamp.dates = "1841"
+        db.update_stamp("stamp-001", stamp)
+        assert not db.is_name_in_use("Penny Black")
+        assert db.is_image_path_in_use("/images/red.jpg")
+        
+        # Edited in place again without update_stamp, then deleted
+        stamp.country = "Great Britain"
+        db.delete_stamp("stamp-001")
+        assert db.get_country_set() == {"Mauritius"}
+        assert not db.is_name_in_use("Penny Red")
+        assert not db.is_image_path_in_use("/images/red.jpg")
+        assert db.get_decade_statistics() == {"1840s": 1}
+    
+    def test_get_stamps_by_decade(self, db):
+        """Test that the decade index returns the matching stamps."""
+        db.add_stamp(Stamp(unique_id="s1", name="Stamp 1", dates="1840"))
+        db.add_stamp(Stamp(unique_id="s2", name="Stamp 2", dates="1840 to 1850"))
+        db.add_stamp(Stamp(unique_id="s3", name="Stamp 3", dates=""))
+        
+        assert [s.unique_id for s in db.get_stamps_by_decade("1840s")] == ["s1", "s2"]
+        assert [s.unique_id for s in db.get_stamps_by_decade("Unknown")] == ["s3"]
+        assert db.get_stamps_by_decade("1900s") == []
+        assert db.get_stamps_by_decade("invalid") == []
+    
+    def test_decade_change_keeps_collection_order(self, db):
+        """Test that the decade filter matches collection-order filtering after an in-place date edit."""
+        db.add_stamps([
+            Stamp(unique_id="s1", name="Stamp 1", country="France", dates="1850"),
+            Stamp(unique_id="s2", name="Stamp 2", country="France", dates="1840"),
+            Stamp(unique_id="s3", name="Stamp 3", country="Spain", dates="circa 1845"),
+            Stamp(unique_id="s4", name="Stamp 4", country="France", dates="unknown"),
+        ])
+        
+        stamp = db.get_stamp("s1")
+        stamp.dates = "1841"
+        db.update_stamp("s1", stamp)
+        stamp = db.get_stamp("s4")
+        stamp.dates = "1848"
+        db.update_stamp("s4", stamp)
+        
+        def decade_of(stamp):
+            year = stamp.year()
+            return None if year is None else get_decade_from_year(year)
+        
+        for label in ("1840s", "1850s", "Unknown"):
+            decade = parse_decade_string(label)
+            expected = [s.unique_id for s in db.get_all_stamps() if decade_of(s) == decade]
+            assert [s.unique_id for s in db.get_stamps_by_decade(label)] == expected
+        assert [s.unique_id for s in db.get_stamps_by_decade("1840s")] == ["s1", "s2", "s3", "s4"]
+        
+        # Scanning the smaller bucket for the other filter keeps that order too
+        by_decade = db.get_stamps_by_decade("1840s")
+        assert [s.unique_id for s in by_decade if s.country == "France"] == ["s1", "s2", "s4"]
+    
     def test_get_decade_statistics_various_formats(self, db):
         """Test decade statistics with various date formats."""
         stamps = [
@@ -256,3 +256,31 @@ class TestSearchStamps:
         results = db.search_stamps("1918")
         assert len(results) == 1
         assert results[0].unique_id == "s3"
+    
+    def test_stamp_matches_search(self, sample_stamps):
+        """Test that per-stamp matching agrees with search_stamps."""
+        db = StampDatabase()
+        for stamp in sample_stamps:
+            db.add_stamp(stamp)
+        
+        for text in ["penny", "usa", "rare", "001", "zzz"]:
+            expected = [s.unique_id for s in db.search_stamps(text)]
+            matched = [s.unique_id for s in sample_stamps if s.matches_search(text)]
+            assert matched == expected
+    
+    def test_search_does_not_match_across_fields(self):
+        """Test that a match cannot span the end of one field and the start of the next."""
+        stamp = Stamp(name="Penny", country="Black")
+        assert stamp.matches_search("penny")
+        assert not stamp.matches_search("pennyblack")
+    
+    def test_search_follows_edited_fields(self):
+        """Test that editing a field in place is reflected in later searches."""
+        stamp = Stamp(name="Penny Black")
+        assert stamp.matches_search("penny")
+        
+        stamp.name = "Twopenny Blue"
+        stamp.keywords = "Rare"
+        assert not stamp.matches_search("black")
+        assert stamp.matches_search("blue")
+        assert stamp.matches_search("rare")
@@ -0,0 +1,89 @@
+"""
+Test the list model behind the main window's stamp list.
+"""
+import pytest
+
+pytest.importorskip("PySide6")
+from PySide6.QtCore import Qt
+
+from model import Stamp
+
+pytestmark = pytest.mark.qt
+
+
+@pytest.fixture
+def list_model(qtbot):
+    """An empty StampListModel; qtbot provides the QApplication."""
+    from view import StampListModel
+    return StampListModel()
+
+
+def _rows(list_model):
+    """Get (display text, unique_id) for every row, read back through data()."""
+    return [
+        (list_model.data(list_model.index(row), Qt.DisplayRole),
+         list_model.data(list_model.index(row), Qt.UserRole))
+        for row in range(list_model.rowCount())
+    ]
+
+
+def test_set_rows_resets_the_list(list_model, qtbot):
+    """Test that set_rows replaces every row in a single model reset."""
+    list_model.set_rows([Stamp(unique_id="a", name="Penny Black", country="United Kingdom")])
+    
+    with qtbot.waitSignal(list_model.modelReset, timeout=1000):
+        list_model.set_rows([
+            Stamp(unique_id="b", name="Blue Mauritius", country="Mauritius"),
+            Stamp(unique_id="c", name="Inverted Jenny"),
+            Stamp(unique_id="d3adbeef00", name=""),
+        ])
+    
+    assert list_model.rowCount() == 3
+    assert _rows(list_model) == [
+        ("Blue Mauritius (Mauritius)", "b"),
+        ("Inverted Jenny", "c"),
+        ("Stamp d3adbeef", "d3adbeef00"),
+    ]
+    assert list_model.row_of("a") is None
+
+
+def test_row_changes_keep_rows_and_ids_in_step(list_model, qtmodeltester):
+    """Test appending, updating and removing rows, including an update after a middle removal."""
+    list_model.set_rows([Stamp(unique_id=uid, name=uid.upper()) for uid in ("a", "b", "c")])
+    list_model.append_stamp(Stamp(unique_id="d", name="D", country="France"))
+    assert _rows(list_model) == [("A", "a"), ("B", "b"), ("C", "c"), ("D (France)", "d")]
+    
+    assert list_model.update_stamp("b", Stamp(unique_id="b", name="B2"))
+    assert list_model.remove_stamp("b")
+    assert _rows(list_model) == [("A", "a"), ("C", "c"), ("D (France)", "d")]
+    
+    # Rows after the removed one have shifted up, and updates must find them there
+    assert list_model.update_stamp("d", Stamp(unique_id="d", name="D2", country="Spain"))
+    assert list_model.update_stamp("c", Stamp(unique_id="c", name="C2"))
+    list_model.append_stamp(Stamp(unique_id="e", name="E"))
+    assert list_model.update_stamp("e", Stamp(unique_id="e", name="E2"))
+    assert _rows(list_model) == [("A", "a"), ("C2", "c"), ("D2 (Spain)", "d"), ("E2", "e")]
+    assert [list_model.row_of(uid) for uid in ("a", "c", "d", "e")] == [0, 1, 2, 3]
+    
+    # Unknown IDs are reported rather than touching another row
+    assert not list_model.update_stamp("b", Stamp(unique_id="b", name="B3"))
+    assert not list_model.remove_stamp("b")
+    assert list_model.rowCount() == 4
+    
+    qtmodeltester.check(list_model)
+
+
+def test_remove_emits_row_signals(list_model, qtbot):
+    """Test that removing a stamp reports the removed row to attached views."""
+    list_model.set_rows([Stamp(unique_id=uid, name=uid) for uid in ("a", "b", "c")])
+    
+    with qtbot.waitSignal(list_model.rowsRemoved, timeout=1000) as blocker:
+        list_model.remove_stamp("b")
+    
+    _, first, last = blocker.args
+    assert (first, last) == (1, 1)
+    assert list_model.row_of("c") == 1
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
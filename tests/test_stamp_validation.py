@@ -100,3 +100,23 @@ class TestStampValidation:
         
         # Should be able to keep the same name when editing
         assert database.is_name_in_use("Penny Black", exclude_id="s1") is False
+    
+    def test_name_check_follows_updates_and_deletes(self, database):
+        """Test that renamed and deleted stamps free their name and image path."""
+        database.update_stamp("s1", Stamp(name="Penny Red", image_path="/images/red.jpg"))
+        assert not database.is_name_in_use("Penny Black")
+        assert database.is_name_in_use("Penny Red")
+        assert database.is_image_path_in_use("/images/red.jpg")
+        
+        database.delete_stamp("s1")
+        assert not database.is_name_in_use("Penny Red")
+        assert not database.is_image_path_in_use("/images/red.jpg")
+    
+    def test_name_check_inside_buffered_block(self, database):
+        """Test that stamps added in a buffered block are already seen as in use."""
+        with database.buffered():
+            database.add_stamp(Stamp(unique_id="s9", name="Penny Lilac", image_path="/images/lilac.jpg"))
+            assert database.is_name_in_use("Penny Lilac")
+            assert not database.is_name_in_use("Penny Lilac", exclude_id="s9")
+            assert database.is_image_path_in_use("/images/lilac.jpg")
+        assert database.is_name_in_use("Penny Lilac")
@@ -2,16 +2,13 @@
 Test the View menu Full Details toggle functionality.
 """
 import pytest
-import os
 
 
-def test_stamp_details_widget_has_full_details_mode():
+def test_stamp_details_widget_has_full_details_mode(view_source):
     """Test that StampDetailsWidget has the full details mode methods."""
     # Since we can't actually import due to Qt dependencies in CI, we'll verify
     # the code structure by reading the file
-    view_file_path = os.path.join(os.path.dirname(__file__), '..', 'view.py')
-    with open(view_file_path, 'r') as f:
-        content = f.read()
+    content = view_source
     
     # Check for key additions
     assert 'self.show_unique_id = False' in content
@@ -21,11 +18,9 @@ def test_stamp_details_widget_has_full_details_mode():
     assert 'self.unique_id_label.setVisible(self.show_unique_id)' in content
 
 
-def test_main_window_has_view_menu():
+def test_main_window_has_view_menu(view_source):
     """Test that MainWindow has the View menu."""
-    view_file_path = os.path.join(os.path.dirname(__file__), '..', 'view.py')
-    with open(view_file_path, 'r') as f:
-        content = f.read()
+    content = view_source
     
     # Check for View menu addition
     assert 'view_menu = menu_bar.addMenu("View")' in content
@@ -36,11 +31,9 @@ def test_main_window_has_view_menu():
     assert 'self.details_widget.set_full_details_mode(checked)' in content
 
 
-def test_default_full_details_is_off():
+def test_default_full_details_is_off(view_source):
     """Test that Full Details defaults to off."""
-    view_file_path = os.path.join(os.path.dirname(__file__), '..', 'view.py')
-    with open(view_file_path, 'r') as f:
-        content = f.read()
+    content = view_source
     
     # Default state should be False/off
     assert 'self.show_unique_id = False' in content
@@ -4,13 +4,13 @@ Implements the GUI using PySide6.
 """
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
-    QListWidget, QLabel, QLineEdit, QTextEdit, QFileDialog,
-    QMessageBox, QDialog, QFormLayout, QListWidgetItem, QScrollArea,
+    QListView, QLabel, QLineEdit, QTextEdit, QFileDialog,
+    QMessageBox, QDialog, QFormLayout, QScrollArea,
     QSplitter, QGroupBox, QComboBox, QTableWidget, QTableWidgetItem, QHeaderView
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, Signal, QAbstractListModel, QModelIndex
 from PySide6.QtGui import QPixmap, QAction
-from typing import Optional, List
+from typing import Dict, Iterable, Optional, List
 import os
 import matplotlib
 matplotlib.use('QtAgg')  # Use Qt backend for matplotlib (Qt5/Qt6 compatible)
@@ -40,17 +40,12 @@ class StampDialog(QDialog):
                 Takes (name, image_path, exclude_id) and returns error message or None if valid.
         """
         super().__init__(parent)
-        self.stamp = stamp
         self.validation_callback = validation_callback
-        self.image_path = stamp.image_path if stamp else ""
         self.setup_ui()
-        
-        if stamp:
-            self.load_stamp_data(stamp)
+        self.reset(stamp)
     
     def setup_ui(self):
         """Set up the dialog UI."""
-        self.setWindowTitle("Add Stamp" if not self.stamp else "Edit Stamp")
         self.setMinimumWidth(500)
         
         layout = QVBoxLayout()
@@ -105,6 +100,29 @@ class StampDialog(QDialog):
         layout.addLayout(button_layout)
         self.setLayout(layout)
     
+    def reset(self, stamp: Optional[Stamp] = None):
+        """
+        Prepare the dialog for another use, so one instance can be reused.
+        
+        Args:
+            stamp: Existing stamp to edit (None for adding new stamp)
+        """
+        self.stamp = stamp
+        self.image_path = ""
+        self.setWindowTitle("Add Stamp" if not stamp else "Edit Stamp")
+        
+        for line_edit in (
+            self.name_edit, self.country_edit, self.dates_edit,
+            self.collection_number_edit, self.catalogue_ids_edit, self.keywords_edit
+        ):
+            line_edit.clear()
+        self.comments_edit.clear()
+        self.image_label.setText("No image selected")
+        
+        if stamp:
+            self.load_stamp_data(stamp)
+        self.name_edit.setFocus()
+    
     def browse_image(self):
         """Open file dialog to select an image."""
         file_path, _ = QFileDialog.getOpenFileName(
@@ -474,6 +492,109 @@ class DecadeStatisticsDialog(QDialog):
 
 
 
+class StampListModel(QAbstractListModel):
+    """
+    List model exposing stamps to a QListView.
+    
+    Display text is produced on demand, so the view only formats the rows it
+    actually paints. The unique_id is available under Qt.UserRole.
+    """
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[Stamp] = []
+        # unique_id -> row, rebuilt lazily after removals shift rows
+        self._row_of: Optional[Dict[str, int]] = {}
+    
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Get the number of stamps in the list."""
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        """Get the display text or unique_id of the stamp at index."""
+        if not index.isValid():
+            return None
+        stamp = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return self.display_text(stamp)
+        if role == Qt.UserRole:
+            return stamp.unique_id
+        return None
+    
+    @staticmethod
+    def display_text(stamp: Stamp) -> str:
+        """Get the list text for a stamp."""
+        display_text = f"{stamp.name} ({stamp.country})" if stamp.country else stamp.name
+        if not display_text:
+            display_text = f"Stamp {stamp.unique_id[:8]}"
+        return display_text
+    
+    def set_rows(self, stamps: Iterable[Stamp]):
+        """Replace all rows in one model reset."""
+        self.beginResetModel()
+        self._rows = list(stamps)
+        self._row_of = None
+        self.endResetModel()
+    
+    def row_of(self, unique_id: str) -> Optional[int]:
+        """Get the row of a stamp, or None if it isn't in the list."""
+        if self._row_of is None:
+            self._row_of = {stamp.unique_id: row for row, stamp in enumerate(self._rows)}
+        return self._row_of.get(unique_id)
+    
+    def append_stamp(self, stamp: Stamp):
+        """Append a single stamp as a new row."""
+        row = len(self._rows)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.append(stamp)
+        if self._row_of is not None:
+            self._row_of[stamp.unique_id] = row
+        self.endInsertRows()
+    
+    def update_stamp(self, unique_id: str, stamp: Stamp) -> bool:
+        """
+        Replace the stamp shown in a row.
+        
+        Args:
+            unique_id: ID of the stamp whose row should be updated
+            stamp: Updated stamp data
+            
+        Returns:
+            True if the stamp was in the list, False otherwise
+        """
+        row = self.row_of(unique_id)
+        if row is None:
+            return False
+        self._rows[row] = stamp
+        if stamp.unique_id != unique_id:
+            del self._row_of[unique_id]
+            self._row_of[stamp.unique_id] = row
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        return True
+    
+    def remove_stamp(self, unique_id: str) -> bool:
+        """
+        Remove a stamp's row.
+        
+        Args:
+            unique_id: ID of the stamp to remove
+            
+        Returns:
+            True if the stamp was in the list, False otherwise
+        """
+        row = self.row_of(unique_id)
+        if row is None:
+            return False
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._row_of = None
+        self.endRemoveRows()
+        return True
+
+
 class MainWindow(QMainWindow):
     """Main application window."""
     
@@ -484,6 +605,7 @@ class MainWindow(QMainWindow):
     delete_stamp_requested = Signal(str)  # Emits unique_id
     load_database_requested = Signal()
     save_database_requested = Signal()
+    save_binary_requested = Signal()
     new_database_requested = Signal()
     country_filter_changed = Signal(str)  # Emits selected country
     decade_filter_changed = Signal(str)  # Emits selected decade
@@ -568,9 +690,13 @@ class MainWindow(QMainWindow):
         button_layout.addWidget(delete_button)
         list_layout.addLayout(button_layout)
         
-        # List widget
-        self.stamp_list = QListWidget()
-        self.stamp_list.itemSelectionChanged.connect(self.on_selection_changed)
+        # List view; rows all have the same height, so Qt can lay out large
+        # lists without measuring every row
+        self.stamp_model = StampListModel(self)
+        self.stamp_list = QListView()
+        self.stamp_list.setUniformItemSizes(True)
+        self.stamp_list.setModel(self.stamp_model)
+        self.stamp_list.selectionModel().selectionChanged.connect(self.on_selection_changed)
         list_layout.addWidget(self.stamp_list)
         
         list_panel.setLayout(list_layout)
@@ -611,6 +737,10 @@ class MainWindow(QMainWindow):
         save_action.triggered.connect(self.save_database_requested.emit)
         file_menu.addAction(save_action)
         
+        save_binary_action = QAction("Save as Binary...", self)
+        save_binary_action.triggered.connect(self.save_binary_requested.emit)
+        file_menu.addAction(save_binary_action)
+        
         file_menu.addSeparator()
         
         exit_action = QAction("Exit", self)
@@ -637,28 +767,29 @@ class MainWindow(QMainWindow):
         stamps_by_decade_action.triggered.connect(self.decade_statistics_requested.emit)
         statistics_menu.addAction(stamps_by_decade_action)
     
+    def _selected_unique_id(self) -> Optional[str]:
+        """Get the unique_id of the selected stamp, or None if nothing is selected."""
+        selected_indexes = self.stamp_list.selectionModel().selectedIndexes()
+        if selected_indexes:
+            return selected_indexes[0].data(Qt.UserRole)
+        return None
+    
     def on_selection_changed(self):
         """Handle stamp selection change."""
-        selected_items = self.stamp_list.selectedItems()
-        if selected_items:
-            item = selected_items[0]
-            unique_id = item.data(Qt.UserRole)
+        unique_id = self._selected_unique_id()
+        if unique_id is not None:
             self.stamp_selected.emit(unique_id)
     
     def on_edit_clicked(self):
         """Handle edit button click."""
-        selected_items = self.stamp_list.selectedItems()
-        if selected_items:
-            item = selected_items[0]
-            unique_id = item.data(Qt.UserRole)
+        unique_id = self._selected_unique_id()
+        if unique_id is not None:
             self.edit_stamp_requested.emit(unique_id)
     
     def on_delete_clicked(self):
         """Handle delete button click."""
-        selected_items = self.stamp_list.selectedItems()
-        if selected_items:
-            item = selected_items[0]
-            unique_id = item.data(Qt.UserRole)
+        unique_id = self._selected_unique_id()
+        if unique_id is not None:
             
             # Confirm deletion
             reply = QMessageBox.question(
@@ -671,17 +802,66 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.Yes:
                 self.delete_stamp_requested.emit(unique_id)
     
+    def apply_diff(
+        self,
+        added: Iterable[Stamp] = (),
+        removed: Iterable[str] = (),
+        updated: Iterable[Stamp] = ()
+    ):
+        """
+        Apply incremental changes to the stamp list instead of rebuilding it.
+        
+        Args:
+            added: Stamps to append to the list
+            removed: Unique IDs of stamps to remove from the list
+            updated: Stamps whose items should be refreshed; stamps that are
+                not in the list yet are appended
+        """
+        self.stamp_list.setUpdatesEnabled(False)
+        try:
+            for unique_id in removed:
+                self.remove_list_item(unique_id)
+            for stamp in updated:
+                if not self.update_list_item(stamp.unique_id, stamp):
+                    self.add_list_item(stamp)
+            for stamp in added:
+                self.add_list_item(stamp)
+        finally:
+            self.stamp_list.setUpdatesEnabled(True)
+    
     def update_stamp_list(self, stamps: List[Stamp]):
         """Update the list of stamps."""
-        self.stamp_list.clear()
-        for stamp in stamps:
-            display_text = f"{stamp.name} ({stamp.country})" if stamp.country else stamp.name
-            if not display_text:
-                display_text = f"Stamp {stamp.unique_id[:8]}"
+        # A single model reset; rows are only formatted when painted
+        self.stamp_model.set_rows(stamps)
+    
+    def add_list_item(self, stamp: Stamp):
+        """Append a single stamp to the list."""
+        self.stamp_model.append_stamp(stamp)
+    
+    def update_list_item(self, unique_id: str, stamp: Stamp) -> bool:
+        """
+        Update the text of a single stamp's list item in place.
+        
+        Args:
+            unique_id: ID of the stamp whose item should be updated
+            stamp: Updated stamp data
+            
+        Returns:
+            True if the stamp was in the list, False otherwise
+        """
+        return self.stamp_model.update_stamp(unique_id, stamp)
+    
+    def remove_list_item(self, unique_id: str) -> bool:
+        """
+        Remove a single stamp from the list.
+        
+        Args:
+            unique_id: ID of the stamp to remove
             
-            item = QListWidgetItem(display_text)
-            item.setData(Qt.UserRole, stamp.unique_id)
-            self.stamp_list.addItem(item)
+        Returns:
+            True if the stamp was in the list, False otherwise
+        """
+        return self.stamp_model.remove_stamp(unique_id)
     
     def update_country_filter(self, countries: List[str]):
         """
@@ -691,21 +871,11 @@ class MainWindow(QMainWindow):
             countries: List of country names to add to the filter.
                       Empty strings and None values are filtered out.
         """
-        current_selection = self.country_filter.currentText()
-        self.country_filter.clear()
-        
-        # Add "All Countries" as first option
-        self.country_filter.addItem("All Countries")
-        
-        # Add unique countries
-        for country in sorted(countries):
-            if country and country.strip():  # Only add non-empty countries
-                self.country_filter.addItem(country)
-        
-        # Restore previous selection if it still exists
-        index = self.country_filter.findText(current_selection)
-        if index >= 0:
-            self.country_filter.setCurrentIndex(index)
+        # "All Countries" first, then the unique non-empty countries
+        options = ["All Countries"] + sorted(
+            country for country in countries if country and country.strip()
+        )
+        self._set_combo_options(self.country_filter, options, self.on_country_filter_changed)
     
     def update_decade_filter(self, decades: List[str]):
         """
@@ -714,21 +884,42 @@ class MainWindow(QMainWindow):
         Args:
             decades: List of decade strings to add to the filter (should be pre-sorted).
         """
-        current_selection = self.decade_filter.currentText()
-        self.decade_filter.clear()
+        # "All Decades" first, then the decades (already sorted by Controller)
+        options = ["All Decades"] + [decade for decade in decades if decade]
+        self._set_combo_options(self.decade_filter, options, self.on_decade_filter_changed)
+    
+    def _set_combo_options(self, combo: QComboBox, options: List[str],
+                           on_changed: Callable[[str], None]):
+        """
+        Replace the options of a filter combo box, keeping its selection.
         
-        # Add "All Decades" as first option
-        self.decade_filter.addItem("All Decades")
+        The combo is left alone when its options are unchanged. Otherwise it is
+        rebuilt with signals blocked, and on_changed is called once if the
+        selected text ends up different.
         
-        # Add decades (assumed to be already sorted by Controller)
-        for decade in decades:
-            if decade:  # Only add non-empty decades
-                self.decade_filter.addItem(decade)
+        Args:
+            combo: Combo box to update
+            options: New option texts, in display order
+            on_changed: Handler to notify if the selection changes
+        """
+        if [combo.itemText(i) for i in range(combo.count())] == options:
+            return
+        
+        current_selection = combo.currentText()
+        combo.blockSignals(True)
+        try:
+            combo.clear()
+            combo.addItems(options)
+            
+            # Restore previous selection if it still exists
+            index = combo.findText(current_selection)
+            if index >= 0:
+                combo.setCurrentIndex(index)
+        finally:
+            combo.blockSignals(False)
         
-        # Restore previous selection if it still exists
-        index = self.decade_filter.findText(current_selection)
-        if index >= 0:
-            self.decade_filter.setCurrentIndex(index)
+        if combo.currentText() != current_selection:
+            on_changed(combo.currentText())
     
     def on_country_filter_changed(self, country: str):
         """Handle country filter change."""
@@ -757,3 +948,13 @@ class MainWindow(QMainWindow):
     def set_status_message(self, message: str):
         """Set status bar message."""
         self.statusBar().showMessage(message)
+    
+    def show_transient_message(self, message: str, ms: int = 2000):
+        """
+        Show a status bar message that clears itself, instead of a modal popup.
+        
+        Args:
+            message: Text to show
+            ms: How long to show it for, in milliseconds
+        """
+        self.statusBar().showMessage(message, ms)